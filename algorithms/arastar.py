@@ -0,0 +1,164 @@
+import time
+from array import array
+from itertools import chain
+from core.arena import NodeArena
+from core.control import CHECK_MASK
+from core.heuristics import get_heuristic
+from core.memory import INT_BYTES, MemoryMeter, check_on_budget, container_bytes, key_bytes, over_budget
+from core.moves import move_table, successors
+from core.openlist import BucketQueue
+from core.puzzle_state import PuzzleState, encode
+from core.utils import board_to_1d, is_solvable, make_stats
+
+SCALE = 10  # weights are applied in tenths, so priorities stay integers for the bucket queue
+DEADLINE_MASK = 15  # expansions between clock reads
+
+
+def solve(start_board, goal_board, heuristic='manhattan', deadline=None, weight=3.0, weight_step=0.5,
+          on_solution=None, control=None, memory_budget=None, on_budget='abort'):
+    """Anytime Repairing A* (ARA*): a quick weighted solution first, then better ones.
+
+    Each round is a weighted A* on g + w*h. When w shrinks by weight_step
+    (down to 1) the open list is re-keyed and states improved after their
+    expansion are put back on it, so earlier work is reused rather than
+    repeated. Every solution comes with suboptimality_bound: its cost is at
+    most that factor times the optimum (1.0 proves it optimal).
+
+    deadline, in seconds from the call, stops the search and returns the best
+    path so far (deadline_reached in the stats); without one the search runs
+    until the bound reaches 1. on_solution(path, solution) is called for each
+    published solution, and stats['solutions'] lists them all.
+    Over memory_budget the best path so far is returned if there is one.
+    """
+    start_time = time.time()
+    deadline_at = start_time + deadline if deadline is not None else None
+    start_state = PuzzleState(start_board, g=0)
+    goal_key = encode(goal_board)
+    n = start_state.n
+    check_on_budget(on_budget)
+    meter = MemoryMeter(memory_budget)
+
+    if start_state.is_goal(goal_key):
+        return [start_state], make_stats([start_state], 0, 1, 1, start_time, weight=1.0,
+                                         suboptimality_bound=1.0, solutions=[], deadline_reached=False)
+    if not is_solvable(board_to_1d(start_board), n, board_to_1d(goal_board)):
+        return [], make_stats([], 0, 0, 0, start_time, weight=None, suboptimality_bound=None,
+                              solutions=[], deadline_reached=False)
+
+    table = move_table(n)
+    heuristic = fallback_h = get_heuristic(heuristic, goal_board)
+    delta = getattr(heuristic, 'delta', None)
+    w = max(SCALE, round(weight * SCALE))
+    step = max(1, round(weight_step * SCALE))
+
+    arena = NodeArena(n)
+    best = {start_state.key: arena.add(start_state.key, start_state.blank, 0)}  # key -> cheapest node
+    h_scores = array('H', [heuristic(start_state)])  # parallel to the arena
+    frontier = BucketQueue()
+    frontier.push(0, w * h_scores[0], 0)
+    closed = set()
+    incons = []  # improved after expansion in this round; reopened when w shrinks
+    kb = key_bytes(n)
+
+    def live_bytes():
+        return (arena.nbytes() + container_bytes(best, kb) + container_bytes(closed, kb)
+                + frontier.nbytes(INT_BYTES) + container_bytes(incons, INT_BYTES)
+                + len(h_scores) * h_scores.itemsize)
+
+    nodes_expanded = 0
+    max_frontier = 1
+    solutions = []
+    bound = None
+    stop = None  # 'deadline' or 'memory'
+
+    while True:
+        # one weighted round: expand until no open state could beat the goal's g
+        while frontier:
+            goal_idx = best.get(goal_key)
+            if goal_idx is not None and SCALE * arena.g[goal_idx] <= frontier.min_f():
+                break
+            max_frontier = max(max_frontier, len(frontier))
+            current = frontier.pop()
+            key = arena.keys[current]
+            if best[key] != current:
+                continue  # superseded by a cheaper node for the same state
+            closed.add(key)
+            nodes_expanded += 1
+            if not nodes_expanded & DEADLINE_MASK:
+                if deadline_at is not None and time.time() >= deadline_at:
+                    stop = 'deadline'
+                    break
+                if not nodes_expanded & CHECK_MASK:
+                    if control is not None:
+                        control.check(nodes_expanded, len(frontier), start_time)
+                    if meter.sample(live_bytes()):
+                        stop = 'memory'
+                        break
+
+            g = arena.g[current] + 1
+            h = h_scores[current]
+            empty = arena.blanks[current]
+            for code, child, blank in successors(key, empty, arena.moves[current], table):
+                old = best.get(child)
+                if old is not None and arena.g[old] <= g:
+                    continue
+                if old is not None:
+                    child_h = h_scores[old]
+                elif delta:
+                    child_h = delta(h, (key >> (table.bits * blank)) & table.mask, blank, empty, child)
+                else:
+                    child_h = heuristic(child)
+                idx = best[child] = arena.add(child, blank, g, current, code)
+                h_scores.append(child_h)
+                if child in closed:
+                    incons.append(idx)
+                else:
+                    frontier.push(idx, SCALE * g + w * child_h, g)
+
+        goal_idx = best.get(goal_key)
+        if stop is not None or goal_idx is None:
+            break
+
+        cost = arena.g[goal_idx]
+        # no unexpanded state has a lower unweighted f, so the optimum is at least this
+        lower = min((arena.g[i] + h_scores[i] for i in chain(frontier.items(), incons)
+                     if best[arena.keys[i]] == i), default=cost)
+        bound = max(1.0, min(w / SCALE, cost / lower)) if lower else 1.0
+        if not solutions or cost < solutions[-1]['path_length'] or bound < solutions[-1]['suboptimality_bound']:
+            solution = {'path_length': cost, 'weight': w / SCALE, 'suboptimality_bound': bound,
+                        'time': time.time() - start_time, 'nodes_expanded': nodes_expanded}
+            solutions.append(solution)
+            if on_solution is not None:
+                on_solution(arena.path(goal_idx), solution)
+        if bound == 1.0:
+            break
+        if deadline_at is not None and time.time() >= deadline_at:
+            stop = 'deadline'
+            break
+
+        # next round: smaller weight, open and INCONS states re-keyed, closed emptied
+        w = max(SCALE, w - step)
+        reopened = BucketQueue()
+        for i in chain(frontier.items(), incons):
+            if best[arena.keys[i]] == i:
+                g = arena.g[i]
+                reopened.push(i, SCALE * g + w * h_scores[i], g)
+        frontier = reopened
+        incons = []
+        closed.clear()
+
+    meter.sample(live_bytes())
+    extra = dict(weight=solutions[-1]['weight'] if solutions else None, suboptimality_bound=bound,
+                 solutions=solutions, deadline_reached=stop == 'deadline', peak_memory_bytes=meter.peak)
+    goal_idx = best.get(goal_key)
+    if goal_idx is None:
+        stats = make_stats([], nodes_expanded, len(best), max_frontier, start_time, **extra)
+        if stop == 'memory':
+            return over_budget(meter, on_budget, stats, start_board, goal_board, control, heuristic=fallback_h)
+        return [], stats
+    # a goal reached mid-round is no worse than the last published one, whose bound still holds
+    path = arena.path(goal_idx)
+    stats = make_stats(path, nodes_expanded, len(best), max_frontier, start_time, **extra)
+    if stop == 'memory':
+        stats['memory_budget_exceeded'] = True
+    return path, stats
@@ -1,47 +1,127 @@
 
 import time
-import heapq
-from core.puzzle_state import PuzzleState
-from core.utils import make_stats, manhattan_distance
+from array import array
+from core.arena import NodeArena
+from core.control import CHECK_MASK
+from core.heuristics import get_heuristic
+from core.memory import INT_BYTES, MemoryMeter, check_on_budget, container_bytes, key_bytes, over_budget
+from core.moves import move_table, successors
+from core.openlist import BucketQueue
+from core.puzzle_state import PuzzleState, encode
+from core.utils import make_stats
 
-def solve(start_board, goal_board):
-    """A* Search with Manhattan distance (Admissible & Consistent for 8-puzzle)."""
+def solve(start_board, goal_board, heuristic='manhattan', control=None, probe=None,
+          memory_budget=None, on_budget='abort'):
+    """A* Search (Complete & Optimal with an admissible heuristic).
+
+    heuristic is a name from core.heuristics.HEURISTICS, a list of names
+    (their maximum), or a heuristic object. Heuristics with a delta() method
+    are updated incrementally per move instead of re-evaluated. The open list
+    is a core.openlist.BucketQueue; ties on f go to the deepest node.
+    A node whose g improves while it is queued is pushed again and the old
+    entry is skipped when popped (stale_pops in the stats); an improved node
+    that was already expanded goes back on the open list (reopenings, only
+    possible with an inconsistent heuristic).
+    The IDA* fallback over memory_budget uses the same heuristic.
+    """
     start_time = time.time()
     start_state = PuzzleState(start_board, g=0)
-    start_state.h = manhattan_distance(start_state, goal_board)
+    goal_key = encode(goal_board)
+    table = move_table(start_state.n)
+    check_on_budget(on_budget)
+    meter = MemoryMeter(memory_budget)
+    heuristic = fallback_h = get_heuristic(heuristic, goal_board)
+    delta = getattr(heuristic, 'delta', None)
+    start_state.h = heuristic(start_state)
     start_state.f = start_state.g + start_state.h
 
-    if start_state.is_goal(goal_board):
-        return [start_state], make_stats([start_state], 0, 1, 1, start_time)
+    if start_state.is_goal(goal_key):
+        return [start_state], make_stats([start_state], 0, 1, 1, start_time, stale_pops=0, reopenings=0)
+
+    arena = NodeArena(start_state.n)
+    frontier = BucketQueue()
+    frontier.push(arena.add(start_state.key, start_state.blank, 0), start_state.f, 0)
+    push, pop, expand = frontier.push, frontier.pop, successors
+    duplicate = None
+    if probe is not None:
+        probe.begin('astar')
+        duplicate = probe.counter('duplicate')
+        push = probe.timed('push', push, 'push')
+        pop = probe.timed('pop', pop, 'pop')
+        expand = probe.timed_successors(expand)
+        if delta:
+            delta = probe.timed('heuristic', delta)
+        else:
+            heuristic = probe.timed('heuristic', heuristic)
+
+    g_scores = {start_state.key: 0}
+    closed = set()
+    h_scores = array('H', [start_state.h])  # parallel to the arena
+    kb = key_bytes(start_state.n)
 
-    frontier = []
-    heapq.heappush(frontier, start_state)
-    g_scores = {start_state: 0}
+    def live_bytes():
+        return (arena.nbytes() + container_bytes(g_scores, kb) + container_bytes(closed, kb)
+                + frontier.nbytes(INT_BYTES) + len(h_scores) * h_scores.itemsize)
 
     nodes_expanded = 0
     max_frontier = 1
     visited_states = 1
+    stale_pops = 0
+    reopenings = 0
+
+    try:
+        while frontier:
+            max_frontier = max(max_frontier, len(frontier))
+            current = pop()
+            key = arena.keys[current]
+            if arena.g[current] > g_scores[key]:
+                # superseded by a cheaper copy pushed later
+                stale_pops += 1
+                continue
+            closed.add(key)
+            nodes_expanded += 1
+            if not nodes_expanded & CHECK_MASK:
+                if control is not None:
+                    control.check(nodes_expanded, len(frontier), start_time)
+                if meter.sample(live_bytes()):
+                    stats = make_stats([], nodes_expanded, visited_states, max_frontier, start_time,
+                                       peak_memory_bytes=meter.peak, stale_pops=stale_pops,
+                                       reopenings=reopenings)
+                    if probe is not None:
+                        probe.end()
+                    return over_budget(meter, on_budget, stats, start_state.board, goal_board, control,
+                                       heuristic=fallback_h)
+
+            if key == goal_key:
+                meter.sample(live_bytes())
+                path = arena.path(current)
+                return path, make_stats(path, nodes_expanded, visited_states, max_frontier, start_time,
+                                        peak_memory_bytes=meter.peak, stale_pops=stale_pops,
+                                        reopenings=reopenings)
+
+            g = arena.g[current] + 1
+            h = h_scores[current]
+            empty = arena.blanks[current]
+            for code, child, blank in expand(key, empty, arena.moves[current], table):
+                if child not in g_scores or g < g_scores[child]:
+                    g_scores[child] = g
+                    if child in closed:
+                        closed.discard(child)
+                        reopenings += 1
+                    if delta:
+                        # only the tile that slid into the old blank cell changes distance
+                        child_h = delta(h, (key >> (table.bits * blank)) & table.mask, blank, empty, child)
+                    else:
+                        child_h = heuristic(child)
+                    h_scores.append(child_h)
+                    push(arena.add(child, blank, g, current, code), g + child_h, g)
+                    visited_states = len(g_scores)
+                elif duplicate:
+                    duplicate()
+    finally:
+        if probe is not None:
+            probe.end()
 
-    while frontier:
-        max_frontier = max(max_frontier, len(frontier))
-        current = heapq.heappop(frontier)
-        nodes_expanded += 1
-
-        if current.is_goal(goal_board):
-            path = []
-            cur = current
-            while cur:
-                path.append(cur)
-                cur = cur.parent
-            path.reverse()
-            return path, make_stats(path, nodes_expanded, visited_states, max_frontier, start_time)
-
-        for n in current.get_neighbors():
-            n.h = manhattan_distance(n, goal_board)
-            n.f = n.g + n.h
-            if n not in g_scores or n.g < g_scores[n]:
-                g_scores[n] = n.g
-                heapq.heappush(frontier, n)
-                visited_states = len(g_scores)
-
-    return [], make_stats([], nodes_expanded, visited_states, max_frontier, start_time)
+    meter.sample(live_bytes())
+    return [], make_stats([], nodes_expanded, visited_states, max_frontier, start_time,
+                          peak_memory_bytes=meter.peak, stale_pops=stale_pops, reopenings=reopenings)
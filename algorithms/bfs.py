@@ -1,42 +1,135 @@
 
 import time
 from collections import deque
-from core.puzzle_state import PuzzleState
+from core.arena import NodeArena
+from core.control import CHECK_MASK
+from core.memory import (MemoryMeter, TUPLE_BYTES, check_on_budget, container_bytes, key_bytes,
+                         over_budget)
+from core.moves import move_table, successors
+from core.puzzle_state import PuzzleState, encode, replay
+from core.ranking import Bitset, check_dense, rank, trace_moves
 from core.utils import make_stats
 
-def solve(start_board, goal_board):
-    """Breadth-First Search (Complete & Optimal for unit cost)"""
+def solve(start_board, goal_board, dense=False, control=None, probe=None,
+          memory_budget=None, on_budget='abort'):
+    """Breadth-First Search (Complete & Optimal for unit cost)
+
+    dense=True tracks visited states in a bitset indexed by permutation rank
+    and keeps one parent-move byte per rank instead of a node arena.
+    """
     start_time = time.time()
     start_state = PuzzleState(start_board, g=0)
+    goal_key = encode(goal_board)
+    table = move_table(start_state.n)
+    check_on_budget(on_budget)
+    meter = MemoryMeter(memory_budget)
 
-    if start_state.is_goal(goal_board):
+    if start_state.is_goal(goal_key):
         return [start_state], make_stats([start_state], 0, 1, 1, start_time)
+    if dense:
+        if probe is not None:
+            raise ValueError("dense mode does not take a probe")
+        return _solve_dense(start_state, goal_key, table, start_time, control, meter, on_budget, goal_board)
+
+    arena = NodeArena(start_state.n)
+    frontier = deque([arena.add(start_state.key, start_state.blank, 0)])
+    push, pop, expand = frontier.append, frontier.popleft, successors
+    duplicate = None
+    if probe is not None:
+        probe.begin('bfs')
+        duplicate = probe.counter('duplicate')
+        push = probe.timed('push', push, 'push')
+        pop = probe.timed('pop', pop, 'pop')
+        expand = probe.timed_successors(expand)
+    visited = set([start_state.key])
+    kb = key_bytes(start_state.n)
 
-    frontier = deque([start_state])
-    visited = set([start_state])
+    def live_bytes():
+        return arena.nbytes() + container_bytes(visited, kb) + container_bytes(frontier)
 
     nodes_expanded = 0
     max_frontier = 1
     visited_states = 1
 
+    try:
+        while frontier:
+            max_frontier = max(max_frontier, len(frontier))
+            current = pop()
+            nodes_expanded += 1
+            if not nodes_expanded & CHECK_MASK:
+                if control is not None:
+                    control.check(nodes_expanded, len(frontier), start_time)
+                if meter.sample(live_bytes()):
+                    stats = make_stats([], nodes_expanded, visited_states, max_frontier, start_time,
+                                       peak_memory_bytes=meter.peak)
+                    if probe is not None:
+                        probe.end()
+                    return over_budget(meter, on_budget, stats, start_state.board, goal_board, control)
+
+            key = arena.keys[current]
+            if key == goal_key:
+                meter.sample(live_bytes())
+                path = arena.path(current)
+                return path, make_stats(path, nodes_expanded, visited_states, max_frontier, start_time,
+                                        peak_memory_bytes=meter.peak)
+
+            g = arena.g[current] + 1
+            for code, child, blank in expand(key, arena.blanks[current], arena.moves[current], table):
+                if child not in visited:
+                    visited.add(child)
+                    visited_states += 1
+                    push(arena.add(child, blank, g, current, code))
+                elif duplicate:
+                    duplicate()
+    finally:
+        if probe is not None:
+            probe.end()
+
+    meter.sample(live_bytes())
+    return [], make_stats([], nodes_expanded, visited_states, max_frontier, start_time,
+                          peak_memory_bytes=meter.peak)
+
+
+def _solve_dense(start_state, goal_key, table, start_time, control, meter, on_budget, goal_board):
+    size = start_state.n * start_state.n
+    states = check_dense(size)
+    visited = Bitset(states)
+    parent_moves = bytearray(states)  # move code + 1
+    visited.add(rank(start_state.key, size))
+    frontier = deque([(start_state.key, start_state.blank, -1)])
+    fixed = visited.nbytes() + len(parent_moves)
+
+    def live_bytes():
+        return fixed + container_bytes(frontier, TUPLE_BYTES)
+
+    nodes_expanded = 0
+    max_frontier = 1
+
     while frontier:
         max_frontier = max(max_frontier, len(frontier))
-        current = frontier.popleft()
+        key, empty, last = frontier.popleft()
         nodes_expanded += 1
+        if not nodes_expanded & CHECK_MASK:
+            if control is not None:
+                control.check(nodes_expanded, len(frontier), start_time)
+            if meter.sample(live_bytes()):
+                stats = make_stats([], nodes_expanded, len(visited), max_frontier, start_time,
+                                   peak_memory_bytes=meter.peak)
+                return over_budget(meter, on_budget, stats, start_state.board, goal_board, control)
+
+        if key == goal_key:
+            meter.sample(live_bytes())
+            path = replay(start_state, trace_moves(parent_moves, key, empty, start_state.key, size))
+            return path, make_stats(path, nodes_expanded, len(visited), max_frontier, start_time,
+                                    peak_memory_bytes=meter.peak)
+
+        for code, child, blank in successors(key, empty, last, table):
+            r = rank(child, size)
+            if r not in visited:
+                visited.add(r)
+                parent_moves[r] = code + 1
+                frontier.append((child, blank, code))
 
-        if current.is_goal(goal_board):
-            path = []
-            cur = current
-            while cur:
-                path.append(cur)
-                cur = cur.parent
-            path.reverse()
-            return path, make_stats(path, nodes_expanded, visited_states, max_frontier, start_time)
-
-        for n in current.get_neighbors():
-            if n not in visited:
-                visited.add(n)
-                visited_states += 1
-                frontier.append(n)
-
-    return [], make_stats([], nodes_expanded, visited_states, max_frontier, start_time)
+    meter.sample(live_bytes())
+    return [], make_stats([], nodes_expanded, len(visited), max_frontier, start_time,
+                          peak_memory_bytes=meter.peak)
@@ -0,0 +1,99 @@
+
+import time
+from core.arena import NodeArena
+from core.control import CHECK_MASK
+from core.memory import MemoryMeter, check_on_budget, container_bytes, key_bytes, over_budget
+from core.moves import INVERSE, move_table, successors
+from core.puzzle_state import PuzzleState, replay
+from core.utils import board_to_1d, is_solvable, make_stats
+
+def solve(start_board, goal_board, control=None, memory_budget=None, on_budget='abort'):
+    """Bidirectional BFS (Complete & Optimal for unit cost).
+
+    Searches forward from the start and backward from the goal, always
+    expanding the whole current layer of the smaller frontier, and stops at
+    the first layer in which the two searches meet.
+    """
+    start_time = time.time()
+    start_state = PuzzleState(start_board, g=0)
+    goal_state = PuzzleState(goal_board, g=0)
+    n = start_state.n
+    check_on_budget(on_budget)
+    meter = MemoryMeter(memory_budget)
+
+    if start_state.is_goal(goal_state):
+        return [start_state], make_stats([start_state], 0, 1, 1, start_time,
+                                         forward_frontier=1, backward_frontier=1)
+    if not is_solvable(board_to_1d(start_board), n, board_to_1d(goal_board)):
+        return [], make_stats([], 0, 0, 0, start_time, forward_frontier=0, backward_frontier=0)
+
+    table = move_table(n)
+    arenas = (NodeArena(n), NodeArena(n))
+    seen = ({start_state.key: arenas[0].add(start_state.key, start_state.blank, 0)},
+            {goal_state.key: arenas[1].add(goal_state.key, goal_state.blank, 0)})
+    frontiers = ([0], [0])
+    max_sizes = [1, 1]
+    kb = key_bytes(n)
+
+    def live_bytes(layer):
+        return sum(arenas[s].nbytes() + container_bytes(seen[s], kb) + container_bytes(frontiers[s])
+                   for s in (0, 1)) + container_bytes(layer)
+
+    nodes_expanded = 0
+    meet = None
+
+    while frontiers[0] and frontiers[1] and meet is None:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        arena, mine, other = arenas[side], seen[side], seen[1 - side]
+        other_g = arenas[1 - side].g
+        best = None
+        layer = []
+        for current in frontiers[side]:
+            nodes_expanded += 1
+            if not nodes_expanded & CHECK_MASK:
+                if control is not None:
+                    control.check(nodes_expanded, len(frontiers[0]) + len(frontiers[1]) + len(layer), start_time)
+                if meter.sample(live_bytes(layer)):
+                    stats = make_stats([], nodes_expanded, len(seen[0]) + len(seen[1]),
+                                       max_sizes[0] + max_sizes[1], start_time,
+                                       forward_frontier=max_sizes[0], backward_frontier=max_sizes[1],
+                                       peak_memory_bytes=meter.peak)
+                    return over_budget(meter, on_budget, stats, start_board, goal_board, control)
+            key = arena.keys[current]
+            g = arena.g[current] + 1
+            for code, child, blank in successors(key, arena.blanks[current], arena.moves[current], table):
+                if child in mine:
+                    continue
+                idx = mine[child] = arena.add(child, blank, g, current, code)
+                layer.append(idx)
+                if child in other:
+                    # the layer is finished before stopping, so the shortest meeting wins
+                    length = g + other_g[other[child]]
+                    if best is None or length < best[0]:
+                        best = (length, child)
+        meter.sample(live_bytes(layer))
+        frontiers[side][:] = layer
+        max_sizes[side] = max(max_sizes[side], len(layer))
+        meet = best and best[1]
+
+    stats = dict(forward_frontier=max_sizes[0], backward_frontier=max_sizes[1], peak_memory_bytes=meter.peak)
+    visited_states = len(seen[0]) + len(seen[1])
+    max_frontier = max_sizes[0] + max_sizes[1]
+    if meet is None:
+        return [], make_stats([], nodes_expanded, visited_states, max_frontier, start_time, **stats)
+
+    fwd, bwd = arenas
+    codes = []
+    i = seen[0][meet]
+    while fwd.parents[i] != -1:
+        codes.append(fwd.moves[i])
+        i = fwd.parents[i]
+    codes.reverse()
+    # the backward tree was grown from the goal; walking it towards the goal undoes its moves
+    i = seen[1][meet]
+    while bwd.parents[i] != -1:
+        codes.append(INVERSE[bwd.moves[i]])
+        i = bwd.parents[i]
+
+    path = replay(start_state, codes)
+    return path, make_stats(path, nodes_expanded, visited_states, max_frontier, start_time, **stats)
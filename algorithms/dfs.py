@@ -1,43 +1,213 @@
 
 import time
-from core.puzzle_state import PuzzleState
-from core.utils import make_stats
+from core.arena import NodeArena
+from core.control import CHECK_MASK
+from core.memory import (FRAME_BYTES, MemoryMeter, TUPLE_BYTES, check_on_budget, container_bytes, key_bytes,
+                         over_budget)
+from core.moves import INVERSE, move_table, successors
+from core.puzzle_state import PuzzleState, encode, replay
+from core.ranking import Bitset, check_dense, rank, trace_moves
+from core.utils import board_to_1d, is_solvable, make_stats
 
-def solve(start_board, goal_board, max_depth=50):
-    """Depth-First Search with depth-limit (Not Optimal)."""
+TT_SIZE = 1 << 18  # every 8-puzzle state fits; deeper boards stay bounded
+
+def solve(start_board, goal_board, max_depth=50, dense=False, control=None,
+          memory_budget=None, on_budget='abort', iterative=True, tt_size=TT_SIZE):
+    """Depth-First Search: iterative deepening (Complete & Optimal up to max_depth, linear memory).
+
+    Depth limits 1, 2, ..., max_depth are searched in turn on one flat board
+    edited in place; a state is rejected only if it is on the current path,
+    so the first solution found is a shortest one. stats['iterations'] lists
+    the nodes of every depth limit. tt_size bounds a transposition table,
+    cleared every iteration and dropped over memory_budget; 0 disables it.
+    The default fits every 8-puzzle state.
+
+    iterative=False runs the older depth-limited DFS with a global visited
+    set (Not Optimal); dense=True implies it, keeping the visited set as a
+    bitset indexed by permutation rank and one parent-move byte per rank.
+    """
     start_time = time.time()
     start_state = PuzzleState(start_board, g=0)
+    goal_key = encode(goal_board)
+    table = move_table(start_state.n)
+    check_on_budget(on_budget)
+    meter = MemoryMeter(memory_budget)
 
-    if start_state.is_goal(goal_board):
+    if iterative and not dense:
+        return _solve_iterative(start_state, goal_key, table, max_depth, tt_size, start_time, control, meter,
+                                goal_board)
+    if start_state.is_goal(goal_key):
         return [start_state], make_stats([start_state], 0, 1, 1, start_time)
+    if dense:
+        return _solve_dense(start_state, goal_key, table, max_depth, start_time, control, meter, on_budget,
+                            goal_board)
 
-    stack = [(start_state, 0)]
+    arena = NodeArena(start_state.n)
+    stack = [arena.add(start_state.key, start_state.blank, 0)]
     visited = set()
+    kb = key_bytes(start_state.n)
+
+    def live_bytes():
+        return arena.nbytes() + container_bytes(visited, kb) + container_bytes(stack)
+
     nodes_expanded = 0
     max_frontier = 1
     visited_states = 0
 
     while stack:
         max_frontier = max(max_frontier, len(stack))
-        current, depth = stack.pop()
+        current = stack.pop()
 
-        if current in visited:
+        key = arena.keys[current]
+        if key in visited:
             continue
-        visited.add(current)
+        visited.add(key)
         visited_states = len(visited)
         nodes_expanded += 1
+        if not nodes_expanded & CHECK_MASK:
+            if control is not None:
+                control.check(nodes_expanded, len(stack), start_time)
+            if meter.sample(live_bytes()):
+                stats = make_stats([], nodes_expanded, visited_states, max_frontier, start_time,
+                                   peak_memory_bytes=meter.peak)
+                return over_budget(meter, on_budget, stats, start_state.board, goal_board, control)
 
-        if current.is_goal(goal_board):
-            path = []
-            cur = current
-            while cur:
-                path.append(cur)
-                cur = cur.parent
-            path.reverse()
-            return path, make_stats(path, nodes_expanded, visited_states, max_frontier, start_time)
+        if key == goal_key:
+            meter.sample(live_bytes())
+            path = arena.path(current)
+            return path, make_stats(path, nodes_expanded, visited_states, max_frontier, start_time,
+                                    peak_memory_bytes=meter.peak)
 
+        depth = arena.g[current]
         if depth < max_depth:
-            for n in reversed(current.get_neighbors()):
-                stack.append((n, depth + 1))
+            for code, child, blank in reversed(list(successors(key, arena.blanks[current], arena.moves[current], table))):
+                stack.append(arena.add(child, blank, depth + 1, current, code))
+
+    meter.sample(live_bytes())
+    return [], make_stats([], nodes_expanded, visited_states, max_frontier, start_time,
+                          peak_memory_bytes=meter.peak)
+
+
+def _solve_dense(start_state, goal_key, table, max_depth, start_time, control, meter, on_budget, goal_board):
+    size = start_state.n * start_state.n
+    states = check_dense(size)
+    visited = Bitset(states)
+    parent_moves = bytearray(states)  # move code + 1, written when a state is expanded
+    stack = [(start_state.key, start_state.blank, 0, -1)]
+    fixed = visited.nbytes() + len(parent_moves)
+
+    def live_bytes():
+        return fixed + container_bytes(stack, TUPLE_BYTES)
+    nodes_expanded = 0
+    max_frontier = 1
+
+    while stack:
+        max_frontier = max(max_frontier, len(stack))
+        key, empty, depth, last = stack.pop()
+
+        r = rank(key, size)
+        if r in visited:
+            continue
+        visited.add(r)
+        parent_moves[r] = last + 1
+        nodes_expanded += 1
+        if not nodes_expanded & CHECK_MASK:
+            if control is not None:
+                control.check(nodes_expanded, len(stack), start_time)
+            if meter.sample(live_bytes()):
+                stats = make_stats([], nodes_expanded, len(visited), max_frontier, start_time,
+                                   peak_memory_bytes=meter.peak)
+                return over_budget(meter, on_budget, stats, start_state.board, goal_board, control)
+
+        if key == goal_key:
+            meter.sample(live_bytes())
+            path = replay(start_state, trace_moves(parent_moves, key, empty, start_state.key, size))
+            return path, make_stats(path, nodes_expanded, len(visited), max_frontier, start_time,
+                                    peak_memory_bytes=meter.peak)
+
+        if depth < max_depth:
+            for code, child, blank in reversed(list(successors(key, empty, last, table))):
+                stack.append((child, blank, depth + 1, code))
+
+    meter.sample(live_bytes())
+    return [], make_stats([], nodes_expanded, len(visited), max_frontier, start_time,
+                          peak_memory_bytes=meter.peak)
+
+
+def _solve_iterative(start_state, goal_key, table, max_depth, tt_size, start_time, control, meter, goal_board):
+    n = start_state.n
+    if start_state.is_goal(goal_key):
+        return [start_state], make_stats([start_state], 0, 1, 1, start_time, iterations=[])
+    if not is_solvable(board_to_1d(start_state.board), n, board_to_1d(goal_board)):
+        return [], make_stats([], 0, 0, 0, start_time, iterations=[])
+
+    moves = table.moves
+    board = board_to_1d(start_state.board)
+    codes = []
+    on_path = {start_state.key}
+    tt = {}
+    kb = key_bytes(n)
+    nodes = 0
+    tt_dropped = False
+
+    def live_bytes():
+        return (container_bytes(board, 8) + container_bytes(codes) + len(codes) * FRAME_BYTES
+                + container_bytes(on_path, kb) + container_bytes(tt, kb))
+
+    def search(key, blank, left, last):
+        nonlocal nodes, tt_size, tt_dropped
+        if key == goal_key:
+            return True
+        if not left:
+            return False
+        if tt_size:
+            seen = tt.get(key)
+            if seen is not None and seen >= left:
+                return False
+            if seen is not None or len(tt) < tt_size:
+                tt[key] = left
+        nodes += 1
+        if not nodes & CHECK_MASK:
+            if control is not None:
+                control.check(nodes, len(codes), start_time)
+            if meter.sample(live_bytes()) and tt_size:
+                tt.clear()
+                tt_size = 0
+                tt_dropped = True
+        undo = INVERSE[last] if last >= 0 else -1
+        for code, c, tshift, bshift in moves[blank]:
+            if code == undo:
+                continue
+            tile = board[c]
+            child = key ^ (tile << tshift) ^ (tile << bshift)
+            if child in on_path:
+                continue
+            # make
+            board[blank] = tile
+            board[c] = 0
+            on_path.add(child)
+            codes.append(code)
+            if search(child, c, left - 1, code):
+                return True
+            # unmake
+            codes.pop()
+            on_path.discard(child)
+            board[c] = tile
+            board[blank] = 0
+        return False
+
+    iterations = []
+    found = False
+    for limit in range(1, max_depth + 1):
+        before = nodes
+        tt.clear()
+        found = search(start_state.key, start_state.blank, limit, -1)
+        iterations.append({'depth_limit': limit, 'nodes_expanded': nodes - before})
+        if found:
+            break
 
-    return [], make_stats([], nodes_expanded, visited_states, max_frontier, start_time)
+    meter.sample(live_bytes())
+    path = replay(start_state, codes) if found else []
+    extra = {'tt_dropped': True} if tt_dropped else {}
+    return path, make_stats(path, nodes, nodes, len(codes) + 1, start_time, iterations=iterations,
+                            peak_memory_bytes=meter.peak, **extra)
@@ -0,0 +1,236 @@
+import os
+import queue
+import time
+from array import array
+from core.arena import NodeArena
+from core.control import CHECK_MASK
+from core.heuristics import get_heuristic
+from core.memory import INT_BYTES, MemoryMeter, check_on_budget, container_bytes, key_bytes, over_budget
+from core.moves import INVERSE, move_table, slide, successors
+from core.openlist import BucketQueue
+from core.puzzle_state import PuzzleState, encode, replay
+from core.utils import board_to_1d, is_solvable, make_stats
+
+UNSOLVED = 0x7fffffff  # incumbent cost before any goal is expanded
+CHUNK = 16  # expansions between inbox checks and flushes of outgoing batches
+POLL = 0.002  # seconds between termination checks in the coordinator
+_MIX = 0x9E3779B97F4A7C15
+_MASK64 = (1 << 64) - 1
+
+# problem shared with the forked workers (table, heuristic, goal), set only while solve() runs
+_job = None
+
+
+def owner(key, workers):
+    """Worker that owns a packed state: a multiplicative hash of the key, folded to 64 bits."""
+    return ((((key ^ (key >> 61)) * _MIX) & _MASK64) >> 32) % workers
+
+
+def solve(start_board, goal_board, heuristic='manhattan', workers=None, batch=128, control=None,
+          memory_budget=None, on_budget='abort'):
+    """Hash-Distributed A* (HDA*): A* split across worker processes (Optimal, admissible heuristic).
+
+    Each state belongs to the worker its key hashes to (owner()); children
+    owned elsewhere travel in batches of at most `batch` nodes. workers
+    defaults to all cores; with workers < 2, or without fork, this is
+    astar.solve(). memory_budget is summed over the workers.
+    """
+    global _job
+    import multiprocessing
+    start_time = time.time()
+    start_state = PuzzleState(start_board, g=0)
+    goal_state = PuzzleState(goal_board, g=0)
+    n = start_state.n
+    workers = workers or os.cpu_count() or 1
+    check_on_budget(on_budget)
+
+    if workers < 2 or 'fork' not in multiprocessing.get_all_start_methods():
+        from algorithms import astar
+        path, stats = astar.solve(start_board, goal_board, heuristic, control=control,
+                                  memory_budget=memory_budget, on_budget=on_budget)
+        stats['workers'] = 1
+        return path, stats
+    if start_state.is_goal(goal_state):
+        return [start_state], make_stats([start_state], 0, 1, 1, start_time, workers=workers)
+    if not is_solvable(board_to_1d(start_board), n, board_to_1d(goal_board)):
+        return [], make_stats([], 0, 0, 0, start_time, workers=workers)
+
+    heuristic = get_heuristic(heuristic, goal_board)
+    meter = MemoryMeter(memory_budget)
+    table = move_table(n)
+    ctx = multiprocessing.get_context('fork')
+    shared = {
+        'incumbent': ctx.Value('i', UNSOLVED),
+        'idle': ctx.Array('b', workers, lock=False),
+        'sent': ctx.Array('q', workers, lock=False),
+        'received': ctx.Array('q', workers, lock=False),
+        'expanded': ctx.Array('q', workers, lock=False),
+        'memory': ctx.Array('q', workers, lock=False),
+    }
+    inboxes = [ctx.Queue() for _ in range(workers)]
+    replies = ctx.Queue()
+    _job = (n, table, heuristic, encode(goal_board), start_state, workers, batch, inboxes, replies, shared)
+    procs = [ctx.Process(target=_worker, args=(i,), daemon=True) for i in range(workers)]
+    stopped = False
+    try:
+        for p in procs:
+            p.start()
+        idle, sent, received = shared['idle'], shared['sent'], shared['received']
+        over = False
+        previous = None
+        while True:
+            time.sleep(POLL)
+            expanded = sum(shared['expanded'])
+            if control is not None:
+                control.check(expanded, 0, start_time)
+            if meter.sample(sum(shared['memory'])):
+                over = True
+                break
+            # counters are read one at a time, so quiescence must be seen twice in a row
+            snapshot = (tuple(idle), tuple(sent), tuple(received))
+            quiet = all(snapshot[0]) and sum(snapshot[1]) == sum(snapshot[2])
+            if quiet and snapshot == previous:
+                break
+            previous = snapshot if quiet else None
+
+        codes = []
+        cost = shared['incumbent'].value
+        if not over and cost != UNSOLVED:
+            key, blank = goal_state.key, goal_state.blank
+            for _ in range(cost):
+                inboxes[owner(key, workers)].put(('trace', key))
+                code = replies.get()
+                codes.append(code)
+                key, blank = slide(key, blank, INVERSE[code], table)
+            codes.reverse()
+        for inbox in inboxes:
+            inbox.put(('stop',))
+        per_worker = sorted(replies.get() for _ in range(workers))
+        stopped = True
+    finally:
+        _job = None
+        for p in procs:
+            # cancelled or failed: do not wait for workers that are still searching
+            p.join(timeout=1 if stopped else 0)
+            if p.is_alive():
+                p.terminate()
+
+    nodes_expanded = sum(w[1] for w in per_worker)
+    visited_states = sum(w[2] for w in per_worker)
+    max_frontier = sum(w[3] for w in per_worker)
+    extra = dict(workers=workers, worker_expansions=[w[1] for w in per_worker],
+                 stale_pops=sum(w[4] for w in per_worker), batches_sent=sum(sent),
+                 peak_memory_bytes=meter.peak)
+    if over:
+        stats = make_stats([], nodes_expanded, visited_states, max_frontier, start_time, **extra)
+        return over_budget(meter, on_budget, stats, start_board, goal_board, control, heuristic=heuristic)
+    path = replay(start_state, codes) if cost != UNSOLVED else []
+    return path, make_stats(path, nodes_expanded, visited_states, max_frontier, start_time, **extra)
+
+
+def _worker(me):
+    n, table, heuristic, goal_key, start_state, workers, batch, inboxes, replies, shared = _job
+    delta = getattr(heuristic, 'delta', None)
+    incumbent = shared['incumbent']
+    idle, sent, received = shared['idle'], shared['sent'], shared['received']
+    inbox = inboxes[me]
+    outgoing = [[] for _ in range(workers)]
+
+    arena = NodeArena(n)
+    best = {}  # key -> cheapest node of the states this worker owns
+    h_scores = array('H')  # parallel to the arena
+    frontier = BucketQueue()
+    kb = key_bytes(n)
+
+    def live_bytes():
+        return (arena.nbytes() + container_bytes(best, kb) + frontier.nbytes(INT_BYTES)
+                + len(h_scores) * h_scores.itemsize)
+
+    def insert(key, blank, g, h, move):
+        old = best.get(key)
+        if old is not None and arena.g[old] <= g:
+            return
+        idx = best[key] = arena.add(key, blank, g, -1, move)
+        h_scores.append(h)
+        frontier.push(idx, g + h, g)
+
+    def send(dest):
+        inboxes[dest].put(('nodes', outgoing[dest]))
+        outgoing[dest] = []
+        sent[me] += 1
+
+    if owner(start_state.key, workers) == me:
+        insert(start_state.key, start_state.blank, 0, heuristic(start_state), -1)
+    expanded = stale = max_open = chunks = 0
+    bound = incumbent.value
+
+    while True:
+        busy = bool(frontier) and frontier.min_f() < bound
+        try:
+            msg = inbox.get_nowait() if busy else inbox.get(timeout=POLL)
+        except queue.Empty:
+            msg = None
+        if msg is not None:
+            if msg[0] == 'nodes':
+                # busy before counted as received, so the coordinator never sees a false quiet
+                idle[me] = 0
+                for key, blank, g, h, move in msg[1]:
+                    insert(key, blank, g, h, move)
+                received[me] += 1
+            elif msg[0] == 'trace':
+                replies.put(arena.moves[best[msg[1]]])
+            else:
+                replies.put((me, expanded, len(best), max_open, stale))
+                for q in inboxes:
+                    q.cancel_join_thread()  # batches nobody will read must not block exit
+                return
+            continue
+
+        bound = incumbent.value
+        if not busy:
+            shared['memory'][me] = live_bytes()  # sampled by the coordinator before it can stop
+            idle[me] = 1  # outgoing batches were flushed after the last chunk
+            continue
+
+        max_open = max(max_open, len(frontier))
+        for _ in range(CHUNK):
+            if not frontier or frontier.min_f() >= bound:
+                break
+            current = frontier.pop()
+            key = arena.keys[current]
+            if best[key] != current:
+                stale += 1
+                continue
+            expanded += 1
+            g = arena.g[current]
+            if key == goal_key:
+                with incumbent.get_lock():
+                    if g < incumbent.value:
+                        incumbent.value = g
+                    bound = incumbent.value
+                continue
+            h = h_scores[current]
+            empty = arena.blanks[current]
+            g += 1
+            for code, child, blank in successors(key, empty, arena.moves[current], table):
+                if delta:
+                    child_h = delta(h, (key >> (table.bits * blank)) & table.mask, blank, empty, child)
+                else:
+                    child_h = heuristic(child)
+                if g + child_h >= bound:
+                    continue
+                dest = owner(child, workers)
+                if dest == me:
+                    insert(child, blank, g, child_h, code)
+                else:
+                    outgoing[dest].append((child, blank, g, child_h, code))
+                    if len(outgoing[dest]) >= batch:
+                        send(dest)
+        # low-f children waiting in a batch are the main source of search overhead
+        for dest in range(workers):
+            if outgoing[dest]:
+                send(dest)
+        chunks += 1
+        shared['expanded'][me] = expanded
+        if not chunks & (CHECK_MASK // CHUNK):
+            shared['memory'][me] = live_bytes()
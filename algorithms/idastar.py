@@ -0,0 +1,116 @@
+
+import time
+from core.control import CHECK_MASK
+from core.heuristics import ManhattanHeuristic, get_heuristic
+from core.memory import FRAME_BYTES, MemoryMeter, check_on_budget, container_bytes, key_bytes
+from core.moves import INVERSE, move_table
+from core.puzzle_state import PuzzleState, encode, replay
+from core.utils import board_to_1d, is_solvable, make_stats
+
+def solve(start_board, goal_board, tt_size=0, heuristic='manhattan', control=None,
+          memory_budget=None, on_budget='abort'):
+    """Iterative-Deepening A* (Complete & Optimal with an admissible heuristic, linear memory).
+
+    The search edits one flat board in place and undoes each move on the way
+    back, so memory grows with solution depth only. tt_size > 0 enables a
+    transposition table of at most that many entries, cleared every
+    iteration, which prunes states already searched at a lower g.
+    heuristic is resolved as in astar.solve().
+    Only the transposition table can outgrow memory_budget: once it does the
+    table is dropped for the rest of the search (either on_budget value), and
+    stats report tt_dropped.
+    """
+    start_time = time.time()
+    start_state = PuzzleState(start_board, g=0)
+    goal_key = encode(goal_board)
+    n = start_state.n
+    check_on_budget(on_budget)
+    meter = MemoryMeter(memory_budget)
+
+    if start_state.is_goal(goal_key):
+        return [start_state], make_stats([start_state], 0, 1, 1, start_time, iterations=[])
+    if not is_solvable(board_to_1d(start_board), n, board_to_1d(goal_board)):
+        return [], make_stats([], 0, 0, 0, start_time, iterations=[])
+
+    moves = move_table(n).moves
+    heuristic = get_heuristic(heuristic, goal_board)
+    # Manhattan rows are inlined; other heuristics go through delta() or a full call
+    rows = heuristic.table if isinstance(heuristic, ManhattanHeuristic) else None
+    delta = getattr(heuristic, 'delta', None)
+    board = board_to_1d(start_board)
+    codes = []
+    tt = {}
+    kb = key_bytes(n)
+    nodes = 0
+    next_bound = 0
+    tt_dropped = False
+
+    def live_bytes():
+        return (container_bytes(board, 8) + container_bytes(codes) + len(codes) * FRAME_BYTES
+                + container_bytes(tt, kb))
+
+    def search(key, blank, g, h, bound, last):
+        nonlocal nodes, next_bound, tt_size, tt_dropped
+        f = g + h
+        if f > bound:
+            if f < next_bound:
+                next_bound = f
+            return False
+        if key == goal_key:
+            return True
+        if tt_size:
+            seen = tt.get(key)
+            if seen is not None and seen <= g:
+                return False
+            if seen is not None or len(tt) < tt_size:
+                tt[key] = g
+        nodes += 1
+        if not nodes & CHECK_MASK:
+            if control is not None:
+                # the frontier of a depth-first search is its current path
+                control.check(nodes, len(codes), start_time)
+            if meter.sample(live_bytes()) and tt_size:
+                tt.clear()
+                tt_size = 0
+                tt_dropped = True
+        undo = INVERSE[last] if last >= 0 else -1
+        for code, c, tshift, bshift in moves[blank]:
+            if code == undo:
+                continue
+            tile = board[c]
+            child = key ^ (tile << tshift) ^ (tile << bshift)
+            if rows is not None:
+                child_h = h - rows[tile][c] + rows[tile][blank]
+            elif delta:
+                child_h = delta(h, tile, c, blank, child)
+            else:
+                child_h = heuristic(child)
+            # make
+            board[blank] = tile
+            board[c] = 0
+            codes.append(code)
+            if search(child, c, g + 1, child_h, bound, code):
+                return True
+            # unmake
+            codes.pop()
+            board[c] = tile
+            board[blank] = 0
+        return False
+
+    iterations = []
+    h0 = bound = heuristic(start_state)
+    while True:
+        next_bound = float('inf')
+        before = nodes
+        tt.clear()
+        found = search(start_state.key, start_state.blank, 0, h0, bound, -1)
+        iterations.append({'threshold': bound, 'nodes_expanded': nodes - before})
+        if found or next_bound == float('inf'):
+            break
+        bound = next_bound
+
+    meter.sample(live_bytes())
+    path = replay(start_state, codes) if found else []
+    extra = {'tt_dropped': True} if tt_dropped else {}
+    return path, make_stats(path, nodes, nodes, len(codes) + 1, start_time, iterations=iterations,
+                            peak_memory_bytes=meter.peak, **extra)
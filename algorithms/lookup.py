@@ -0,0 +1,42 @@
+
+import time
+from core.distdb import UNREACHED, open_table
+from core.memory import check_on_budget
+from core.moves import slide
+from core.puzzle_state import PuzzleState, replay
+from core.ranking import rank
+from core.symmetry import canonicalize, moves_from_frame
+from core.utils import make_stats
+
+def solve(start_board, goal_board, table_dir=None, control=None, memory_budget=None, on_budget='abort'):
+    """Optimal answer read from a precomputed distance table (no search).
+
+    The query is reduced to its symmetry representative (canonical goal,
+    blank in cell 4, 7 or 8), the table's best move is followed until the
+    distance reaches zero, and the moves are turned back to the query's frame. control,
+    memory_budget and on_budget are accepted for a uniform signature; with at most 31
+    table reads there is nothing to cancel, and the memory-mapped table is not counted.
+    """
+    check_on_budget(on_budget)
+    start_time = time.time()
+    start_state = PuzzleState(start_board, g=0)
+    if start_state.n != 3:
+        raise ValueError("distance tables exist only for 3x3 boards")
+    rel_start, rel_goal, t = canonicalize(start_board, goal_board)
+    table = open_table(PuzzleState(rel_goal).blank, table_dir)
+
+    cur = PuzzleState(rel_start)
+    key, blank = cur.key, cur.blank
+    entry = table[rank(key, 9)]
+    if entry == UNREACHED:
+        return [], make_stats([], 0, 1, 0, start_time)
+
+    codes = []
+    while entry >> 2:
+        code = entry & 3
+        codes.append(code)
+        key, blank = slide(key, blank, code)
+        entry = table[rank(key, 9)]
+
+    path = replay(start_state, moves_from_frame(codes, t))
+    return path, make_stats(path, len(codes), len(path), 1, start_time)
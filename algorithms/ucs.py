@@ -1,20 +1,122 @@
 
 import time
-import heapq
-from core.puzzle_state import PuzzleState
+from core.arena import NodeArena
+from core.control import CHECK_MASK
+from core.memory import (INT_BYTES, MemoryMeter, TUPLE_BYTES, check_on_budget, container_bytes, key_bytes,
+                         over_budget)
+from core.moves import move_table, successors
+from core.openlist import BucketQueue
+from core.puzzle_state import PuzzleState, encode, replay
+from core.ranking import check_dense, rank, trace_moves
 from core.utils import make_stats
 
-def solve(start_board, goal_board):
-    """Uniform Cost Search (Complete & Optimal for unit step cost)."""
+# dense mode pushes a state only at its first (and, with unit costs, final) cost
+_NO_STALE = {'stale_pops': 0, 'reopenings': 0}
+
+
+def solve(start_board, goal_board, dense=False, control=None, probe=None,
+          memory_budget=None, on_budget='abort'):
+    """Uniform Cost Search (Complete & Optimal for unit step cost).
+
+    dense=True keeps best costs and parent moves in byte arrays indexed by
+    permutation rank instead of a dict and a node arena. Both modes keep the
+    open list in a core.openlist.BucketQueue keyed on cost. Queue entries
+    whose cost was since improved are skipped when popped (stale_pops, sparse
+    mode); with unit costs an expanded state is never improved, so the
+    closed set is implicit in best_cost and nothing is reopened.
+    """
     start_time = time.time()
     start_state = PuzzleState(start_board, g=0)
+    goal_key = encode(goal_board)
+    table = move_table(start_state.n)
+    check_on_budget(on_budget)
+    meter = MemoryMeter(memory_budget)
+
+    if start_state.is_goal(goal_key):
+        return [start_state], make_stats([start_state], 0, 1, 1, start_time, stale_pops=0, reopenings=0)
+    if dense:
+        if probe is not None:
+            raise ValueError("dense mode does not take a probe")
+        return _solve_dense(start_state, goal_key, table, start_time, control, meter, on_budget, goal_board)
+
+    arena = NodeArena(start_state.n)
+    frontier = BucketQueue()
+    frontier.push(arena.add(start_state.key, start_state.blank, 0), 0, 0)
+    push, pop, expand = frontier.push, frontier.pop, successors
+    duplicate = None
+    if probe is not None:
+        probe.begin('ucs')
+        duplicate = probe.counter('duplicate')
+        push = probe.timed('push', push, 'push')
+        pop = probe.timed('pop', pop, 'pop')
+        expand = probe.timed_successors(expand)
+
+    best_cost = {start_state.key: 0}
+    kb = key_bytes(start_state.n)
+
+    def live_bytes():
+        return arena.nbytes() + container_bytes(best_cost, kb) + frontier.nbytes(INT_BYTES)
+
+    nodes_expanded = 0
+    max_frontier = 1
+    visited_states = 1
+    stale_pops = 0
+
+    try:
+        while frontier:
+            max_frontier = max(max_frontier, len(frontier))
+            current = pop()
+            cost = arena.g[current]
+            key = arena.keys[current]
+            if cost > best_cost[key]:
+                stale_pops += 1
+                continue
+            nodes_expanded += 1
+            if not nodes_expanded & CHECK_MASK:
+                if control is not None:
+                    control.check(nodes_expanded, len(frontier), start_time)
+                if meter.sample(live_bytes()):
+                    stats = make_stats([], nodes_expanded, visited_states, max_frontier, start_time,
+                                       peak_memory_bytes=meter.peak, stale_pops=stale_pops, reopenings=0)
+                    if probe is not None:
+                        probe.end()
+                    return over_budget(meter, on_budget, stats, start_state.board, goal_board, control)
 
-    if start_state.is_goal(goal_board):
-        return [start_state], make_stats([start_state], 0, 1, 1, start_time)
+            if key == goal_key:
+                meter.sample(live_bytes())
+                path = arena.path(current)
+                return path, make_stats(path, nodes_expanded, visited_states, max_frontier, start_time,
+                                        peak_memory_bytes=meter.peak, stale_pops=stale_pops, reopenings=0)
+
+            new_cost = cost + 1
+            for code, child, blank in expand(key, arena.blanks[current], arena.moves[current], table):
+                if child not in best_cost or new_cost < best_cost[child]:
+                    best_cost[child] = new_cost
+                    push(arena.add(child, blank, new_cost, current, code), new_cost, new_cost)
+                    visited_states = len(best_cost)
+                elif duplicate:
+                    duplicate()
+    finally:
+        if probe is not None:
+            probe.end()
 
-    frontier = []
-    heapq.heappush(frontier, (0, start_state))
-    best_cost = {start_state: 0}
+    meter.sample(live_bytes())
+    return [], make_stats([], nodes_expanded, visited_states, max_frontier, start_time,
+                          peak_memory_bytes=meter.peak, stale_pops=stale_pops, reopenings=0)
+
+
+def _solve_dense(start_state, goal_key, table, start_time, control, meter, on_budget, goal_board):
+    size = start_state.n * start_state.n
+    states = check_dense(size)
+    best_cost = bytearray(b'\xff') * states  # 0xff = not reached yet
+    parent_moves = bytearray(states)  # move code + 1
+    best_cost[rank(start_state.key, size)] = 0
+    frontier = BucketQueue()
+    frontier.push((0, start_state.key, start_state.blank, -1), 0, 0)
+    fixed = len(best_cost) + len(parent_moves)
+
+    def live_bytes():
+        return fixed + frontier.nbytes(TUPLE_BYTES)
 
     nodes_expanded = 0
     max_frontier = 1
@@ -22,23 +124,32 @@ def solve(start_board, goal_board):
 
     while frontier:
         max_frontier = max(max_frontier, len(frontier))
-        cost, current = heapq.heappop(frontier)
+        cost, key, empty, last = frontier.pop()
         nodes_expanded += 1
+        if not nodes_expanded & CHECK_MASK:
+            if control is not None:
+                control.check(nodes_expanded, len(frontier), start_time)
+            if meter.sample(live_bytes()):
+                stats = make_stats([], nodes_expanded, visited_states, max_frontier, start_time,
+                                   peak_memory_bytes=meter.peak, **_NO_STALE)
+                return over_budget(meter, on_budget, stats, start_state.board, goal_board, control)
 
-        if current.is_goal(goal_board):
-            path = []
-            cur = current
-            while cur:
-                path.append(cur)
-                cur = cur.parent
-            path.reverse()
-            return path, make_stats(path, nodes_expanded, visited_states, max_frontier, start_time)
+        if key == goal_key:
+            meter.sample(live_bytes())
+            path = replay(start_state, trace_moves(parent_moves, key, empty, start_state.key, size))
+            return path, make_stats(path, nodes_expanded, visited_states, max_frontier, start_time,
+                                    peak_memory_bytes=meter.peak, **_NO_STALE)
 
-        for n in current.get_neighbors():
-            new_cost = cost + 1
-            if n not in best_cost or new_cost < best_cost[n]:
-                best_cost[n] = new_cost
-                heapq.heappush(frontier, (new_cost, n))
-                visited_states = len(best_cost)
+        new_cost = cost + 1
+        for code, child, blank in successors(key, empty, last, table):
+            r = rank(child, size)
+            if new_cost < best_cost[r]:
+                if best_cost[r] == 0xff:
+                    visited_states += 1
+                best_cost[r] = new_cost
+                parent_moves[r] = code + 1
+                frontier.push((new_cost, child, blank, code), new_cost, new_cost)
 
-    return [], make_stats([], nodes_expanded, visited_states, max_frontier, start_time)
+    meter.sample(live_bytes())
+    return [], make_stats([], nodes_expanded, visited_states, max_frontier, start_time,
+                          peak_memory_bytes=meter.peak, **_NO_STALE)
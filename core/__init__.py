@@ -1,3 +1,3 @@
 
-from .puzzle_state import PuzzleState
+from .puzzle_state import PuzzleState, encode, decode
 from .utils import board_to_2d, board_to_1d, manhattan_distance
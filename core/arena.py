@@ -0,0 +1,54 @@
+from array import array
+
+from .moves import MOVES, bits_for
+from .puzzle_state import PuzzleState
+
+
+class NodeArena:
+    """Search tree stored as parallel columns; nodes are referred to by index.
+
+    A node costs a handful of bytes instead of a PuzzleState object, and the
+    tree holds no object references, so the collector has nothing to walk.
+    """
+    __slots__ = ('n', 'keys', 'blanks', 'g', 'parents', 'moves')
+
+    def __init__(self, n=3):
+        self.n = n
+        # packed 24-puzzle keys need 125 bits and do not fit a machine word
+        self.keys = array('Q') if bits_for(n) * n * n <= 64 else []
+        self.blanks = array('B')
+        self.g = array('I')
+        self.parents = array('q')
+        self.moves = array('b')
+
+    def __len__(self):
+        return len(self.keys)
+
+    def add(self, key, blank, g, parent=-1, move=-1):
+        self.keys.append(key)
+        self.blanks.append(blank)
+        self.g.append(g)
+        self.parents.append(parent)
+        self.moves.append(move)
+        return len(self.keys) - 1
+
+    def nbytes(self):
+        total = sum(col.itemsize * len(col) for col in (self.blanks, self.g, self.parents, self.moves))
+        if isinstance(self.keys, array):
+            return total + self.keys.itemsize * len(self.keys)
+        return total + sum(k.__sizeof__() + 8 for k in self.keys)
+
+    def path(self, idx):
+        """Walk parent indices back to the root and return PuzzleStates start -> idx."""
+        chain = []
+        while idx != -1:
+            chain.append(idx)
+            idx = self.parents[idx]
+        chain.reverse()
+        path = []
+        prev = None
+        for i in chain:
+            move = MOVES[self.moves[i]] if self.moves[i] >= 0 else ""
+            prev = PuzzleState.from_key(self.keys[i], self.blanks[i], prev, move, self.g[i], n=self.n)
+            path.append(prev)
+        return path
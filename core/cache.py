@@ -0,0 +1,133 @@
+"""Solution cache shared by the solver entry points.
+
+Problems are reduced with symmetry.canonicalize() first: the goal is
+relabelled to a canonical one and the board turned to a representative
+rotation/reflection, so up to 8 x (number of relabellings) problems share
+one entry. Moves are stored in the representative's frame and turned back
+on a hit. Entries live in an in-process LRU and, if a path is given, in a
+SQLite file that several processes can share.
+"""
+import importlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from .moves import MOVES
+from .puzzle_state import PuzzleState, encode, replay
+from .symmetry import canonicalize, moves_from_frame, moves_to_frame
+
+LETTERS = 'UDLR'  # one letter per move code, in MOVES order
+
+
+class SolutionCache:
+    """LRU of move strings and stats, optionally backed by SQLite.
+
+    maxsize bounds the in-process LRU; max_disk_entries bounds the SQLite
+    table, whose least recently used tenth is dropped when it overflows.
+    """
+
+    def __init__(self, maxsize=1024, path=None, max_disk_entries=100000):
+        self.maxsize = maxsize
+        self.max_disk_entries = max_disk_entries
+        self.hits = 0
+        self.misses = 0
+        self._lru = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            self._db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+            self._db.execute("CREATE TABLE IF NOT EXISTS solutions "
+                             "(key TEXT PRIMARY KEY, moves TEXT, stats TEXT, used REAL)")
+            self._db.execute("CREATE INDEX IF NOT EXISTS solutions_used ON solutions (used)")
+            self._db.commit()
+
+    @staticmethod
+    def make_key(algorithm, start_board, goal_board, options):
+        """Return (cache key, transform to the stored frame).
+
+        The key is None when an option (e.g. a heuristic object) has no
+        stable text form.
+        """
+        try:
+            opts = json.dumps(options, sort_keys=True)
+        except TypeError:
+            return None, 0
+        rep_start, rep_goal, t = canonicalize(start_board, goal_board)
+        goal = PuzzleState(rep_goal)
+        return '%s|%s|%d|%d|%x' % (algorithm, opts, goal.n, goal.blank, encode(rep_start)), t
+
+    def get(self, key):
+        with self._lock:
+            entry = self._lru.get(key)
+            if entry is not None:
+                self._lru.move_to_end(key)
+                return entry
+            if self._db is None:
+                return None
+            row = self._db.execute("SELECT moves, stats FROM solutions WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._db.execute("UPDATE solutions SET used = ? WHERE key = ?", (time.time(), key))
+            self._db.commit()
+            entry = (row[0], json.loads(row[1]))
+            self._remember(key, entry)
+            return entry
+
+    def put(self, key, moves, stats):
+        with self._lock:
+            self._remember(key, (moves, stats))
+            if self._db is None:
+                return
+            self._db.execute("INSERT OR REPLACE INTO solutions VALUES (?, ?, ?, ?)",
+                             (key, moves, json.dumps(stats), time.time()))
+            count = self._db.execute("SELECT COUNT(*) FROM solutions").fetchone()[0]
+            if count > self.max_disk_entries:
+                self._db.execute("DELETE FROM solutions WHERE key IN "
+                                 "(SELECT key FROM solutions ORDER BY used LIMIT ?)",
+                                 (count - self.max_disk_entries + self.max_disk_entries // 10,))
+            self._db.commit()
+
+    def _remember(self, key, entry):
+        self._lru[key] = entry
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.maxsize:
+            self._lru.popitem(last=False)
+
+    def solve(self, algorithm, start_board, goal_board, control=None, **options):
+        """Same result as algorithms.<algorithm>.solve(), served from the cache when possible.
+
+        The stats dict gains cache_hit, cache_hits and cache_misses;
+        execution_time is the time this call took. A hit returns the stats
+        (and, for solvers with ties, the path) of whichever symmetric
+        variant was solved first. Only solved boards are stored; a search
+        that failed, crossed its memory budget or hit its deadline is rerun
+        next time.
+        """
+        start_time = time.time()
+        key, t = self.make_key(algorithm, start_board, goal_board, options)
+        entry = self.get(key) if key is not None else None
+        if entry is not None:
+            self.hits += 1
+            moves, stats = entry
+            codes = moves_from_frame([LETTERS.index(m) for m in moves], t)
+            path = replay(PuzzleState(start_board, g=0), codes)
+            stats = dict(stats, execution_time=time.time() - start_time)
+            hit = True
+        else:
+            self.misses += 1
+            solver = importlib.import_module('algorithms.' + algorithm)
+            path, stats = solver.solve(start_board, goal_board, control=control, **options)
+            # an over-budget or deadline-cut result may not be the solver's own answer
+            complete = not (stats.get('memory_budget_exceeded') or stats.get('deadline_reached'))
+            if key is not None and stats['solution_found'] and complete:
+                codes = moves_to_frame([MOVES.index(s.move) for s in path[1:]], t)
+                self.put(key, ''.join(LETTERS[c] for c in codes), stats)
+            hit = False
+        return path, dict(stats, cache_hit=hit, cache_hits=self.hits, cache_misses=self.misses)
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
@@ -0,0 +1,50 @@
+"""Cancellation and progress reports for a running search.
+
+Every solver's solve() takes control=None or a SearchControl. The search
+calls control.check() once every CHECK_MASK + 1 expansions; after cancel()
+that raises SearchCancelled out of solve(), otherwise it passes progress to
+the on_progress callback.
+"""
+import threading
+import time
+
+# solvers call SearchControl.check() once every CHECK_MASK + 1 expansions
+CHECK_MASK = 1023
+
+
+class SearchCancelled(Exception):
+    """Raised out of solve() once its SearchControl has been cancelled."""
+
+
+class SearchControl:
+    """Cancellation token and throttled progress callback for one solve() call.
+
+    cancel() may be called from any thread; the search notices it at its
+    next check, i.e. within about a thousand expansions. on_progress, if
+    given, receives {'nodes_expanded', 'frontier', 'elapsed'} at most once
+    per `interval` seconds, on the solver's thread.
+    """
+    __slots__ = ('_event', 'on_progress', 'interval', '_last')
+
+    def __init__(self, on_progress=None, interval=0.1):
+        self._event = threading.Event()
+        self.on_progress = on_progress
+        self.interval = interval
+        self._last = 0.0
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def check(self, nodes_expanded, frontier, start_time):
+        if self._event.is_set():
+            raise SearchCancelled()
+        if self.on_progress is not None:
+            now = time.time()
+            if now - self._last >= self.interval:
+                self._last = now
+                self.on_progress({'nodes_expanded': nodes_expanded, 'frontier': frontier,
+                                  'elapsed': now - start_time})
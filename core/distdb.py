@@ -0,0 +1,101 @@
+"""All-states distance table for the 8-puzzle.
+
+One byte per permutation rank: (distance << 2) | move code of an optimal
+first move, or UNREACHED for the other parity class. The table is built by a
+single BFS backwards from canonical_goal(blank) and is read through mmap, so
+every process that opens the same file shares one copy in the page cache.
+"""
+import mmap
+import os
+import struct
+from collections import deque
+
+from .moves import INVERSE, successors
+from .puzzle_state import PuzzleState
+from .ranking import FACT, rank
+from .utils import canonical_goal
+
+MAGIC = b'8PDT'
+HEADER = struct.Struct('<4sBB26x')  # magic, board width, goal blank cell; 32 bytes
+UNREACHED = 0xFF
+N = 3
+SIZE = N * N
+
+DEFAULT_DIR = os.environ.get(
+    'PUZZLE_DISTDB_DIR', os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data'))
+
+
+def table_path(blank, directory=None):
+    return os.path.join(directory or DEFAULT_DIR, 'distdb3_b%d.bin' % blank)
+
+
+def build(blank=SIZE - 1):
+    """Return the distance/move table for canonical_goal(blank) as a bytearray.
+
+    With NumPy installed the table comes from core.statespace.layered_bfs(),
+    several times faster; distances are the same, ties between optimal moves
+    may be broken differently.
+    """
+    try:
+        from .statespace import layered_bfs
+    except ImportError:  # NumPy is optional
+        pass
+    else:
+        return layered_bfs(canonical_goal(blank, N), table=True)['table']
+    table = bytearray([UNREACHED]) * FACT[SIZE]
+    goal = PuzzleState(canonical_goal(blank, N))
+    table[rank(goal.key, SIZE)] = 0
+    frontier = deque([(goal.key, goal.blank, -1, 0)])
+    while frontier:
+        key, empty, last, dist = frontier.popleft()
+        entry = (dist + 1) << 2
+        for code, child, c in successors(key, empty, last):
+            r = rank(child, SIZE)
+            if table[r] == UNREACHED:
+                # the way back towards the goal undoes the move that reached child
+                table[r] = entry | INVERSE[code]
+                frontier.append((child, c, code, dist + 1))
+    return table
+
+
+def write(path, table, blank):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, N, blank))
+        f.write(table)
+    os.replace(tmp, path)
+
+
+class DistanceTable:
+    """Read-only, memory-mapped view of a table written by write()."""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, n, self.blank = HEADER.unpack_from(self.mm)
+        if magic != MAGIC or n != N or len(self.mm) != HEADER.size + FACT[SIZE]:
+            self.mm.close()
+            raise ValueError("%s is not a 3x3 distance table" % path)
+
+    def __getitem__(self, r):
+        return self.mm[HEADER.size + r]
+
+    def close(self):
+        self.mm.close()
+
+
+_open_tables = {}
+
+
+def open_table(blank, directory=None):
+    """Map the table for goal blank cell `blank`, once per process."""
+    path = table_path(blank, directory)
+    table = _open_tables.get(path)
+    if table is None:
+        if not os.path.exists(path):
+            raise FileNotFoundError(
+                "no distance table for blank cell %d at %s; build it with "
+                "python -m tools.build_distdb --blank %d" % (blank, path, blank))
+        table = _open_tables[path] = DistanceTable(path)
+    return table
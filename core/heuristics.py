@@ -0,0 +1,290 @@
+from collections import OrderedDict, deque
+
+from .moves import bits_for
+from .puzzle_state import PuzzleState
+
+
+def _tiles(state, n, bits):
+    """Flat tile list of a PuzzleState or packed key."""
+    key = state.key if isinstance(state, PuzzleState) else state
+    mask = (1 << bits) - 1
+    flat = []
+    for _ in range(n * n):
+        flat.append(key & mask)
+        key >>= bits
+    return flat
+
+
+class ManhattanHeuristic:
+    """Manhattan distance compiled once for a goal board.
+
+    table[tile][cell] is the distance of tile from its goal cell, so a full
+    evaluation is one lookup per tile and a single slide is O(1) via delta().
+    """
+    __slots__ = ('n', 'bits', 'table')
+    name = 'manhattan'
+
+    def __init__(self, goal_board):
+        n = len(goal_board)
+        goal_pos = {}
+        for i in range(n):
+            for j in range(n):
+                goal_pos[goal_board[i][j]] = (i, j)
+        table = [[0] * (n * n) for _ in range(n * n)]
+        for tile, (gx, gy) in goal_pos.items():
+            if tile == 0:
+                continue
+            for c in range(n * n):
+                x, y = divmod(c, n)
+                table[tile][c] = abs(x - gx) + abs(y - gy)
+        self.n = n
+        self.bits = bits_for(n)
+        self.table = table
+
+    def __call__(self, state):
+        key = state.key if isinstance(state, PuzzleState) else state
+        table = self.table
+        bits = self.bits
+        mask = (1 << bits) - 1
+        dist = 0
+        for c in range(self.n * self.n):
+            dist += table[key & mask][c]
+            key >>= bits
+        return dist
+
+    def delta(self, parent_h, moved_tile, frm, to, child_key):
+        row = self.table[moved_tile]
+        return parent_h - row[frm] + row[to]
+
+
+class MisplacedTilesHeuristic:
+    """Number of tiles not on their goal cell."""
+    __slots__ = ('n', 'bits', 'goal_cell')
+    name = 'misplaced'
+
+    def __init__(self, goal_board):
+        self.n = len(goal_board)
+        self.bits = bits_for(self.n)
+        self.goal_cell = [0] * (self.n * self.n)
+        for c, tile in enumerate(t for row in goal_board for t in row):
+            self.goal_cell[tile] = c
+
+    def __call__(self, state):
+        goal_cell = self.goal_cell
+        return sum(1 for c, t in enumerate(_tiles(state, self.n, self.bits)) if t and goal_cell[t] != c)
+
+    def delta(self, parent_h, moved_tile, frm, to, child_key):
+        home = self.goal_cell[moved_tile]
+        return parent_h - (frm != home) + (to != home)
+
+
+def _conflict_cost(goal_lines):
+    """2 * tiles that must leave a line so the rest are in goal order (n - LIS)."""
+    tails = []
+    for v in goal_lines:
+        lo, hi = 0, len(tails)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if tails[mid] < v:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == len(tails):
+            tails.append(v)
+        else:
+            tails[lo] = v
+    return 2 * (len(goal_lines) - len(tails))
+
+
+class LinearConflictHeuristic:
+    """Manhattan distance plus linear conflicts in rows and columns."""
+    __slots__ = ('n', 'bits', 'manhattan', 'goal_row', 'goal_col')
+    name = 'linear_conflict'
+
+    def __init__(self, goal_board):
+        self.n = n = len(goal_board)
+        self.bits = bits_for(n)
+        self.manhattan = ManhattanHeuristic(goal_board)
+        self.goal_row = [0] * (n * n)
+        self.goal_col = [0] * (n * n)
+        for i in range(n):
+            for j in range(n):
+                self.goal_row[goal_board[i][j]] = i
+                self.goal_col[goal_board[i][j]] = j
+
+    def __call__(self, state):
+        n = self.n
+        flat = _tiles(state, n, self.bits)
+        goal_row, goal_col = self.goal_row, self.goal_col
+        h = self.manhattan(state)
+        for i in range(n):
+            row = flat[i * n:i * n + n]
+            h += _conflict_cost([goal_col[t] for t in row if t and goal_row[t] == i])
+            col = flat[i::n]
+            h += _conflict_cost([goal_row[t] for t in col if t and goal_col[t] == i])
+        return h
+
+
+_wd_tables = {}
+
+
+def _walking_table(n, blank_line):
+    """BFS distances over row-occupancy matrices for one axis.
+
+    A matrix entry [r][g] counts tiles sitting in row r whose goal row is g;
+    the goal matrix has n on the diagonal except n-1 in the blank's goal row.
+    Only practical up to 4x4 (24,964 matrices); 5x5 is far larger.
+    """
+    table = _wd_tables.get((n, blank_line))
+    if table is not None:
+        return table
+    if n > 4:
+        raise ValueError("walking distance tables are only built up to 4x4")
+    goal = tuple(tuple((n - (r == blank_line)) if g == r else 0 for g in range(n)) for r in range(n))
+    table = {goal: 0}
+    frontier = deque([(goal, blank_line)])
+    while frontier:
+        m, blank = frontier.popleft()
+        dist = table[m] + 1
+        for src in (blank - 1, blank + 1):
+            if not 0 <= src < n:
+                continue
+            for g in range(n):
+                if not m[src][g]:
+                    continue
+                rows = [list(r) for r in m]
+                rows[src][g] -= 1
+                rows[blank][g] += 1
+                child = tuple(tuple(r) for r in rows)
+                if child not in table:
+                    table[child] = dist
+                    frontier.append((child, src))
+    _wd_tables[(n, blank_line)] = table
+    return table
+
+
+class WalkingDistanceHeuristic:
+    """Walking distance: exact moves for each axis with tiles reduced to their goal line."""
+    __slots__ = ('n', 'bits', 'goal_row', 'goal_col', 'rows', 'cols')
+    name = 'walking_distance'
+
+    @staticmethod
+    def available(n):
+        return n <= 4
+
+    def __init__(self, goal_board):
+        self.n = n = len(goal_board)
+        self.bits = bits_for(n)
+        self.goal_row = [0] * (n * n)
+        self.goal_col = [0] * (n * n)
+        for i in range(n):
+            for j in range(n):
+                self.goal_row[goal_board[i][j]] = i
+                self.goal_col[goal_board[i][j]] = j
+        self.rows = _walking_table(n, self.goal_row[0])
+        self.cols = _walking_table(n, self.goal_col[0])
+
+    def __call__(self, state):
+        n = self.n
+        flat = _tiles(state, n, self.bits)
+        vert = [[0] * n for _ in range(n)]
+        horiz = [[0] * n for _ in range(n)]
+        goal_row, goal_col = self.goal_row, self.goal_col
+        for c, t in enumerate(flat):
+            if t:
+                r, col = divmod(c, n)
+                vert[r][goal_row[t]] += 1
+                horiz[col][goal_col[t]] += 1
+        return (self.rows[tuple(tuple(r) for r in vert)] +
+                self.cols[tuple(tuple(r) for r in horiz)])
+
+
+class MaxHeuristic:
+    """Pointwise maximum of admissible heuristics (admissible itself)."""
+    __slots__ = ('parts', 'name')
+
+    def __init__(self, parts):
+        self.parts = tuple(parts)
+        self.name = 'max(%s)' % ','.join(p.name for p in self.parts)
+
+    def __call__(self, state):
+        return max(h(state) for h in self.parts)
+
+
+def _pdb(split=None):
+    def factory(goal_board):
+        # imported here so the mmap/multiprocessing machinery loads only when asked for
+        from .patterndb import AdditivePDBHeuristic
+        return AdditivePDBHeuristic(goal_board, split)
+
+    def available(n):
+        from .patterndb import tables_exist
+        return tables_exist(n, split)
+
+    factory.available = available
+    return factory
+
+
+HEURISTICS = {
+    'manhattan': ManhattanHeuristic,
+    'linear_conflict': LinearConflictHeuristic,
+    'walking_distance': WalkingDistanceHeuristic,
+    'misplaced': MisplacedTilesHeuristic,
+    'pdb': _pdb(),
+    'pdb663': _pdb('663'),
+    'pdb663s': _pdb('663s'),
+    'pdb78': _pdb('78'),
+}
+
+COMPILED_SIZE = 64  # compiled (name, goal) pairs kept, least recently used dropped first
+
+_compiled = OrderedDict()
+
+
+def register(name, factory):
+    """Add a heuristic factory: factory(goal_board) -> callable(state or key) -> int.
+
+    The heuristic may also have delta(parent_h, moved_tile, frm, to, child_key),
+    the value after moved_tile slid from cell frm to cell to giving child_key,
+    which the searches use instead of a full evaluation. A factory may have
+    an available(n) callable telling whether it can be built for n x n boards
+    (see usable()). Heuristics compiled by an earlier factory of the same name
+    are dropped.
+    """
+    HEURISTICS[name] = factory
+    for key in [key for key in _compiled if key[0] == name]:
+        del _compiled[key]
+
+
+def usable(name, n):
+    """True if the registered heuristic `name` can be built for n x n boards."""
+    available = getattr(HEURISTICS[name], 'available', None)
+    return available is None or available(n)
+
+
+def get_heuristic(spec, goal_board):
+    """Resolve spec for goal_board, compiling each (name, goal) pair once.
+
+    spec is a registered name, a list/tuple of names (their maximum), or an
+    already built heuristic object, which is returned unchanged.
+    """
+    if isinstance(spec, (list, tuple)):
+        return MaxHeuristic(get_heuristic(s, goal_board) for s in spec)
+    if not isinstance(spec, str):
+        return spec
+    if spec not in HEURISTICS:
+        raise ValueError("unknown heuristic %r (known: %s)" % (spec, ', '.join(sorted(HEURISTICS))))
+    key = (spec, tuple(tuple(row) for row in goal_board))
+    h = _compiled.get(key)
+    if h is not None:
+        _compiled.move_to_end(key)
+        return h
+    h = _compiled[key] = HEURISTICS[spec](goal_board)
+    if len(_compiled) > COMPILED_SIZE:
+        _compiled.popitem(last=False)
+    return h
+
+
+def manhattan(goal_board):
+    """Return the ManhattanHeuristic for goal_board, compiling it on first use."""
+    return get_heuristic('manhattan', goal_board)
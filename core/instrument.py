@@ -0,0 +1,134 @@
+"""Optional instrumentation for the search loops.
+
+A solver given probe=SearchProbe() swaps the primitives its loop calls
+(frontier pop/push, successor generation, heuristic) for timed wrappers;
+without a probe it binds the plain functions, so a disabled probe costs
+nothing per node. Time not spent inside a wrapped primitive (duplicate
+checks, hashing, interpreter overhead, and the wrappers' own bookkeeping)
+is reported as the 'other' phase. A 'duplicate' is counted where a child
+is rejected because its state was already reached at no greater cost.
+Instrumented: astar, ucs and bfs; their dense modes raise ValueError when
+given a probe. The solver ends the probe on every way out of its loop,
+before any IDA* fallback over memory_budget.
+
+    probe = SearchProbe(trace=True)
+    astar.solve(start, goal, probe=probe)
+    probe.summary()                          # counts and per-phase ns
+    probe.write_chrome_trace('astar.json')   # chrome://tracing, Perfetto
+    probe.write_collapsed('astar.folded')    # flamegraph.pl, speedscope
+"""
+import json
+from time import perf_counter_ns
+
+EVENTS = ('expand', 'generate', 'duplicate', 'push', 'pop')
+
+
+class SearchProbe:
+    """Event counters, per-phase timings and an optional span trace for one solve().
+
+    on_event(name, n), if given, is called for every event (n children for
+    'generate'). trace=True records up to max_spans individual spans for
+    the Chrome trace export; aggregates are always kept. begin() starts a
+    fresh profile, so a probe can be reused for another solve().
+    """
+
+    def __init__(self, on_event=None, trace=False, max_spans=200000):
+        self.on_event = on_event
+        self.trace = trace
+        self.max_spans = max_spans
+        self.algorithm = None
+        self.counts = dict.fromkeys(EVENTS, 0)
+        self.phase_ns = {}
+        self.spans = []  # (phase, start ns, duration ns)
+        self._start = self._end = None
+
+    def begin(self, algorithm):
+        self.algorithm = algorithm
+        self.counts.update(dict.fromkeys(EVENTS, 0))
+        self.phase_ns.clear()
+        self.spans.clear()
+        self._end = None
+        self._start = perf_counter_ns()
+
+    def end(self):
+        """Stop the clock; later calls do nothing."""
+        if self._end is None:
+            self._end = perf_counter_ns()
+
+    def _record(self, phase, t0, t1):
+        self.phase_ns[phase] = self.phase_ns.get(phase, 0) + t1 - t0
+        if self.trace and len(self.spans) < self.max_spans:
+            self.spans.append((phase, t0, t1 - t0))
+
+    def timed(self, phase, fn, event=None):
+        """Wrap fn so each call is timed under phase and counted as event."""
+        record, counts, on_event = self._record, self.counts, self.on_event
+
+        def wrapper(*args):
+            t0 = perf_counter_ns()
+            result = fn(*args)
+            record(phase, t0, perf_counter_ns())
+            if event:
+                counts[event] += 1
+                if on_event:
+                    on_event(event, 1)
+            return result
+        return wrapper
+
+    def counter(self, event):
+        """Return a function that counts one event per call, for events with no primitive to time."""
+        counts, on_event = self.counts, self.on_event
+
+        def count():
+            counts[event] += 1
+            if on_event:
+                on_event(event, 1)
+        return count
+
+    def timed_successors(self, fn):
+        """Wrap a successor generator; it is drained into a list so the timing is its own."""
+        record, counts, on_event = self._record, self.counts, self.on_event
+
+        def wrapper(*args):
+            t0 = perf_counter_ns()
+            children = list(fn(*args))
+            record('successors', t0, perf_counter_ns())
+            counts['expand'] += 1
+            counts['generate'] += len(children)
+            if on_event:
+                on_event('expand', 1)
+                on_event('generate', len(children))
+            return children
+        return wrapper
+
+    def total_ns(self):
+        end = self._end if self._end is not None else perf_counter_ns()
+        return end - self._start if self._start is not None else 0
+
+    def summary(self):
+        phases = dict(self.phase_ns)
+        phases['other'] = max(0, self.total_ns() - sum(self.phase_ns.values()))
+        return {'algorithm': self.algorithm, 'total_ns': self.total_ns(),
+                'counts': dict(self.counts), 'phase_ns': phases}
+
+    def collapsed(self):
+        """Collapsed-stack lines ('solve;astar;pop 12345'), weights in ns."""
+        root = 'solve;%s' % (self.algorithm or 'search')
+        return ['%s;%s %d' % (root, phase, ns) for phase, ns in sorted(self.summary()['phase_ns'].items()) if ns]
+
+    def write_collapsed(self, path):
+        with open(path, 'w') as f:
+            f.write('\n'.join(self.collapsed()) + '\n')
+
+    def chrome_trace(self):
+        """Trace Event Format dict: one 'X' event per recorded span (needs trace=True)."""
+        base = self._start or 0
+        events = [{'name': self.algorithm or 'search', 'ph': 'X', 'pid': 0, 'tid': 0,
+                   'ts': 0, 'dur': self.total_ns() / 1000}]
+        events.extend({'name': phase, 'ph': 'X', 'pid': 0, 'tid': 0,
+                       'ts': (t0 - base) / 1000, 'dur': dur / 1000} for phase, t0, dur in self.spans)
+        return {'traceEvents': events, 'displayTimeUnit': 'ns', 'otherData': self.summary()}
+
+    def write_chrome_trace(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.chrome_trace(), f)
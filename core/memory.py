@@ -0,0 +1,65 @@
+"""Live-memory estimates and budgets for the solvers.
+
+Solvers sample an estimate of their search structures every
+CHECK_MASK + 1 expansions (and once at the end) and report the largest as
+peak_memory_bytes. The estimate counts container sizes from sys.getsizeof
+plus a fixed cost per stored key or entry, which is close for the int keys
+and small tuples the solvers keep; it does not walk objects.
+
+Every solver's solve() takes memory_budget=None (bytes) and
+on_budget='abort'. With a budget set, a solver that crosses it stops and
+either returns no path with partial stats (on_budget='abort') or hands the
+problem to IDA*, whose memory grows only with solution depth
+(on_budget='fallback').
+"""
+import importlib
+import sys
+
+from .moves import bits_for
+
+ON_BUDGET = ('abort', 'fallback')
+TUPLE_BYTES = sys.getsizeof((0, 0, 0))  # frontier entries are small tuples
+INT_BYTES = sys.getsizeof(1 << 32)  # ... or arena indices
+FRAME_BYTES = 512  # one recursive search() call of IDA*, locals included
+
+
+def key_bytes(n):
+    """Size of the int object holding a packed n x n key at its widest."""
+    return sys.getsizeof(1 << (bits_for(n) * n * n - 1))
+
+
+def container_bytes(container, item_bytes=0):
+    return sys.getsizeof(container) + len(container) * item_bytes
+
+
+class MemoryMeter:
+    """Peak of the sampled estimates, checked against an optional budget in bytes."""
+    __slots__ = ('budget', 'peak')
+
+    def __init__(self, budget=None):
+        self.budget = budget
+        self.peak = 0
+
+    def sample(self, nbytes):
+        """Record an estimate; True once it is over budget."""
+        if nbytes > self.peak:
+            self.peak = nbytes
+        return self.budget is not None and nbytes > self.budget
+
+
+def check_on_budget(on_budget):
+    if on_budget not in ON_BUDGET:
+        raise ValueError("on_budget must be one of %s, got %r" % (', '.join(ON_BUDGET), on_budget))
+
+
+def over_budget(meter, on_budget, stats, start_board, goal_board, control=None, **fallback_options):
+    """Result of a solver that crossed its budget; stats are its partial stats."""
+    stats['memory_budget_exceeded'] = True
+    if on_budget != 'fallback':
+        return [], stats
+    idastar = importlib.import_module('algorithms.idastar')
+    path, fb = idastar.solve(start_board, goal_board, control=control, **fallback_options)
+    fb.update(fallback='idastar', memory_budget_exceeded=True,
+              abandoned_nodes=stats['nodes_expanded'],
+              peak_memory_bytes=max(meter.peak, fb['peak_memory_bytes']))
+    return path, fb
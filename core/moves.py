@@ -0,0 +1,72 @@
+MOVES = ('Up', 'Down', 'Left', 'Right')
+INVERSE = (1, 0, 3, 2)
+_DELTAS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+def bits_for(n):
+    """Bits per cell in a packed n x n key (4 up to the 15-puzzle, 5 for the 24-puzzle)."""
+    return max(4, (n * n - 1).bit_length())
+
+
+class MoveTable:
+    """Legal slides for every blank position of an n x n board.
+
+    moves[blank] is a tuple of (move code, new blank, tile shift, blank shift);
+    the shifts locate the two cells inside a packed key.
+    """
+    __slots__ = ('n', 'bits', 'mask', 'moves')
+
+    def __init__(self, n):
+        bits = bits_for(n)
+        self.n = n
+        self.bits = bits
+        self.mask = (1 << bits) - 1
+        moves = []
+        for b in range(n * n):
+            x, y = divmod(b, n)
+            row = []
+            for code, (dx, dy) in enumerate(_DELTAS):
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < n and 0 <= ny < n:
+                    c = nx * n + ny
+                    row.append((code, c, bits * c, bits * b))
+            moves.append(tuple(row))
+        self.moves = tuple(moves)
+
+
+_TABLES = {}
+
+
+def move_table(n=3):
+    table = _TABLES.get(n)
+    if table is None:
+        table = _TABLES[n] = MoveTable(n)
+    return table
+
+
+def successors(key, blank, parent_move=-1, table=None):
+    """Yield (move code, child key, child blank) for every legal slide.
+
+    If parent_move is given, the slide that would undo it is skipped.
+    """
+    if table is None:
+        table = move_table()
+    mask = table.mask
+    undo = INVERSE[parent_move] if parent_move >= 0 else -1
+    for code, c, tshift, bshift in table.moves[blank]:
+        if code == undo:
+            continue
+        tile = (key >> tshift) & mask
+        # blank is 0, so moving the tile is two xors
+        yield code, key ^ (tile << tshift) ^ (tile << bshift), c
+
+
+def slide(key, blank, code, table=None):
+    """Apply one move by code; return (child key, child blank)."""
+    if table is None:
+        table = move_table()
+    for c_code, c, tshift, bshift in table.moves[blank]:
+        if c_code == code:
+            tile = (key >> tshift) & table.mask
+            return key ^ (tile << tshift) ^ (tile << bshift), c
+    raise ValueError("illegal move %s from cell %d" % (MOVES[code], blank))
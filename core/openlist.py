@@ -0,0 +1,82 @@
+"""Open lists for the best-first solvers.
+
+Priorities in this puzzle are small non-negative integers (f = g + h with
+unit moves), so a bucket queue beats a binary heap: buckets[f] holds one
+LIFO list per g, push and pop are O(1) amortized, and no tuples are
+compared. Among nodes of equal f the deepest (highest g) comes out first,
+which reaches the goal with fewer expansions in the last f layer.
+
+    frontier = BucketQueue()
+    frontier.push(item, f, g)
+    item = frontier.pop()      # lowest f, then highest g, then newest
+"""
+import sys
+
+
+class BucketQueue:
+    """Integer-priority open list: lowest f first, ties to the highest g, then LIFO.
+
+    Priorities may decrease between pops (inconsistent heuristics); the
+    scan pointer moves back to the lowest non-empty bucket.
+    """
+    __slots__ = ('buckets', 'f', 'count')
+
+    def __init__(self):
+        self.buckets = []  # buckets[f][g] is a list of items
+        self.f = 0  # no non-empty bucket below this f
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def push(self, item, f, g):
+        buckets = self.buckets
+        while len(buckets) <= f:
+            buckets.append([])
+        layer = buckets[f]
+        while len(layer) <= g:
+            layer.append([])
+        layer[g].append(item)
+        self.count += 1
+        if f < self.f:
+            self.f = f
+
+    def pop(self):
+        """Remove and return the next item; IndexError when empty."""
+        if not self.count:
+            raise IndexError("pop from an empty BucketQueue")
+        buckets = self.buckets
+        f = self.f
+        while not buckets[f]:
+            f += 1
+        self.f = f
+        layer = buckets[f]
+        top = layer[-1]
+        item = top.pop()
+        # keep layer[-1] non-empty, so the highest g is always at the end
+        while layer and not layer[-1]:
+            layer.pop()
+        self.count -= 1
+        return item
+
+    def min_f(self):
+        """Lowest f present, or None when empty."""
+        if not self.count:
+            return None
+        f = self.f
+        while not self.buckets[f]:
+            f += 1
+        return f
+
+    def items(self):
+        """All queued items, in no particular order."""
+        for layer in self.buckets:
+            for items in layer:
+                yield from items
+
+    def nbytes(self, item_bytes=0):
+        """Estimate of the list structure, plus item_bytes per queued item."""
+        total = sys.getsizeof(self.buckets)
+        for layer in self.buckets:
+            total += sys.getsizeof(layer) + sum(sys.getsizeof(items) for items in layer)
+        return total + self.count * item_bytes
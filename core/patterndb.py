@@ -0,0 +1,248 @@
+"""Additive disjoint pattern databases.
+
+A pattern is a set of goal cells; its tiles are whatever the goal board puts
+there. The abstract state is the cells those tiles occupy, ranked with
+rank_partial(), and the stored value is the fewest moves *of pattern tiles*
+needed to bring them home. The blank and the other tiles are ignored, so
+every real move changes at most one pattern and the values of disjoint
+patterns can be added.
+
+One byte per rank after a 32-byte header; tables are read through mmap like
+the distance tables in distdb. A group whose cells are a rotation or
+reflection of an earlier group's cells reuses that group's table through
+the same transform (see mirror_of()), so symmetric splits such as 663s
+build and map one table fewer.
+"""
+import mmap
+import os
+import struct
+from array import array
+
+from .distdb import DEFAULT_DIR
+from .moves import bits_for, move_table
+from .puzzle_state import PuzzleState
+from .ranking import partial_count, rank_partial, unrank_partial
+from .symmetry import COUNT, cell_map, inverse
+
+MAGIC = b'PPDB'
+HEADER = struct.Struct('<4sBB16s10x')  # magic, board width, pattern size, goal cells; 32 bytes
+UNREACHED = 0xFF
+
+# Splits by board width, as goal cells (canonical goal: blank in the last cell).
+SPLITS = {
+    (3, '44'): ((0, 1, 2, 3), (4, 5, 6, 7)),
+    (4, '663'): ((0, 4, 5, 8, 9, 12), (6, 7, 10, 11, 13, 14), (1, 2, 3)),
+    # second group is the transpose of the first; the diagonal is left over
+    (4, '663s'): ((1, 2, 3, 6, 7, 11), (4, 8, 12, 9, 13, 14), (0, 5, 10)),
+    (4, '78'): ((8, 9, 10, 11, 12, 13, 14), (0, 1, 2, 3, 4, 5, 6, 7)),
+}
+DEFAULT_SPLIT = {3: '44', 4: '663'}
+
+
+def table_path(n, cells, directory=None):
+    return os.path.join(directory or DEFAULT_DIR,
+                        'pdb%d_%s.bin' % (n, '-'.join(str(c) for c in cells)))
+
+
+def mirror_of(n, cells, earlier):
+    """Return (i, t) if cells is earlier[i] moved cell by cell by transform t, else None."""
+    for i, other in enumerate(earlier):
+        if len(other) != len(cells):
+            continue
+        for t in range(1, COUNT):
+            m = cell_map(n, t)
+            if all(m[a] == b for a, b in zip(other, cells)):
+                return i, t
+    return None
+
+
+def tables_exist(n, split=None, directory=None):
+    """True if every table of the split (default: DEFAULT_SPLIT for n) has been built."""
+    split = split or DEFAULT_SPLIT.get(n)
+    if (n, split) not in SPLITS:
+        return False
+    split_cells = SPLITS[(n, split)]
+    # mirrored groups read an earlier group's table
+    return all(os.path.exists(table_path(n, cells, directory)) for j, cells in enumerate(split_cells)
+               if mirror_of(n, cells, split_cells[:j]) is None)
+
+
+def _neighbours(n):
+    return [tuple(c for _, c, _, _ in moves) for moves in move_table(n).moves]
+
+
+# table being built; forked workers inherit it copy-on-write as of the current layer
+_snapshot = None
+
+
+def _expand(args):
+    """New ranks one pattern-tile move away from the given ranks.
+
+    Children already in the layer's snapshot are dropped here, so only
+    first-time ranks travel back to the parent process.
+    """
+    ranks, n, k = args
+    size = n * n
+    adj = _neighbours(n)
+    table = _snapshot
+    seen = set()
+    for r in ranks:
+        cells = unrank_partial(r, size, k)
+        occupied = set(cells)
+        for i, c in enumerate(cells):
+            for to in adj[c]:
+                if to not in occupied:
+                    cells[i] = to
+                    child = rank_partial(cells, size)
+                    if table[child] == UNREACHED:
+                        seen.add(child)
+            cells[i] = c
+    return array('I', seen)
+
+
+def build(n, cells, workers=1, chunk=20000):
+    """Return the table for the pattern on goal cells `cells` as a bytearray.
+
+    Breadth-first from the goal placement, one layer at a time. With
+    workers > 1 each layer is expanded by a freshly forked process pool that
+    sees the table as of that layer; this process only merges the results.
+    Without fork (e.g. on Windows) the build runs in-process.
+    """
+    global _snapshot
+    import multiprocessing
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        workers = 1
+    size = n * n
+    k = len(cells)
+    table = bytearray([UNREACHED]) * partial_count(size, k)
+    goal = rank_partial(cells, size)
+    table[goal] = 0
+    frontier = array('I', [goal])
+    depth = 0
+    _snapshot = table
+    try:
+        while frontier:
+            depth += 1
+            jobs = [(frontier[i:i + chunk], n, k) for i in range(0, len(frontier), chunk)]
+            frontier = array('I')
+            if workers > 1 and len(jobs) > 1:
+                with multiprocessing.get_context('fork').Pool(workers) as pool:
+                    results = list(pool.imap_unordered(_expand, jobs))
+            else:
+                results = map(_expand, jobs)
+            for children in results:
+                for r in children:
+                    if table[r] == UNREACHED:
+                        table[r] = depth
+                        frontier.append(r)
+    finally:
+        _snapshot = None
+    return table
+
+
+def write(path, table, n, cells):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, n, len(cells), bytes(cells)))
+        f.write(table)
+    os.replace(tmp, path)
+
+
+class PatternTable:
+    """Read-only, memory-mapped view of a table written by write()."""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.n, k, cells = HEADER.unpack_from(self.mm)
+        self.cells = tuple(cells[:k])
+        if magic != MAGIC or len(self.mm) != HEADER.size + partial_count(self.n * self.n, k):
+            self.mm.close()
+            raise ValueError("%s is not a pattern database" % path)
+
+    def __getitem__(self, r):
+        return self.mm[HEADER.size + r]
+
+    def close(self):
+        self.mm.close()
+
+
+_open_tables = {}
+
+
+def open_table(n, cells, directory=None):
+    """Map the table for one pattern, once per process."""
+    path = table_path(n, cells, directory)
+    table = _open_tables.get(path)
+    if table is None:
+        if not os.path.exists(path):
+            raise FileNotFoundError(
+                "no pattern database for cells %s at %s; build it with "
+                "python -m tools.build_pdb --width %d" % (list(cells), path, n))
+        table = _open_tables[path] = PatternTable(path)
+    return table
+
+
+class AdditivePDBHeuristic:
+    """Sum of disjoint pattern database values (admissible and consistent).
+
+    A move changes only the moved tile's pattern, so delta() looks up that
+    one group again instead of every group.
+    """
+    __slots__ = ('n', 'size', 'bits', 'mask', 'groups', 'group_of', 'name')
+
+    def __init__(self, goal_board, split=None, directory=None):
+        n = len(goal_board)
+        split = split or DEFAULT_SPLIT.get(n)
+        if (n, split) not in SPLITS:
+            raise ValueError("no pattern database split %r for %dx%d boards" % (split, n, n))
+        flat = [t for row in goal_board for t in row]
+        self.n = n
+        self.size = n * n
+        self.bits = bits_for(n)
+        self.mask = (1 << self.bits) - 1
+        self.name = 'pdb' + split
+        self.groups = []
+        self.group_of = [None] * self.size
+        split_cells = SPLITS[(n, split)]
+        for j, cells in enumerate(split_cells):
+            tiles = tuple(flat[c] for c in cells)
+            if 0 in tiles:
+                raise ValueError("split %r covers the goal blank cell %d" % (split, flat.index(0)))
+            mirror = mirror_of(n, cells, split_cells[:j])
+            if mirror is None:
+                group = (tiles, open_table(n, cells, directory), None)
+            else:
+                # look positions up in the mirrored group's table, turned back to its frame
+                i, t = mirror
+                group = (tiles, open_table(n, split_cells[i], directory), cell_map(n, inverse(t)))
+            self.groups.append(group)
+            for t in tiles:
+                self.group_of[t] = group
+
+    def _positions(self, key):
+        pos = [0] * self.size
+        for c in range(self.size):
+            pos[key & self.mask] = c
+            key >>= self.bits
+        return pos
+
+    def _lookup(self, pos, group):
+        tiles, db, frame = group
+        cells = [pos[t] for t in tiles] if frame is None else [frame[pos[t]] for t in tiles]
+        return db[rank_partial(cells, self.size)]
+
+    def __call__(self, state):
+        key = state.key if isinstance(state, PuzzleState) else state
+        pos = self._positions(key)
+        return sum(self._lookup(pos, group) for group in self.groups)
+
+    def delta(self, parent_h, moved_tile, frm, to, child_key):
+        group = self.group_of[moved_tile]
+        if group is None:
+            return parent_h
+        pos = self._positions(child_key)
+        child = self._lookup(pos, group)
+        pos[moved_tile] = frm
+        return parent_h - self._lookup(pos, group) + child
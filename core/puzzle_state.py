@@ -1,52 +1,96 @@
+from .moves import MOVES, bits_for, successors, slide, move_table
 
-from copy import deepcopy
+N = 3  # default board width
+
+
+def encode(board):
+    """Pack a 2D board into an int, bits_for(n) bits per cell (cell 0 in the low bits)."""
+    bits = bits_for(len(board))
+    key = 0
+    shift = 0
+    for row in board:
+        for tile in row:
+            key |= tile << shift
+            shift += bits
+    return key
+
+
+def decode(key, n=N):
+    """Unpack an int produced by encode() back into a 2D list."""
+    bits = bits_for(n)
+    mask = (1 << bits) - 1
+    flat = [(key >> (bits * i)) & mask for i in range(n * n)]
+    return [flat[i:i + n] for i in range(0, n * n, n)]
+
+
+def blank_of(key, n=N):
+    bits = bits_for(n)
+    mask = (1 << bits) - 1
+    for i in range(n * n):
+        if not (key >> (bits * i)) & mask:
+            return i
+    raise ValueError("board has no blank tile")
 
-N = 3
-SIZE = N * N
 
 class PuzzleState:
+    __slots__ = ('key', 'blank', 'n', 'parent', 'move', 'g', 'h', 'f')
+
     def __init__(self, board, parent=None, move="", g=0, h=0):
-        self.board = board
+        self.n = len(board)
+        self.key = encode(board)
+        self.blank = blank_of(self.key, self.n)
         self.parent = parent
         self.move = move
         self.g = g
         self.h = h
         self.f = g + h
 
+    @classmethod
+    def from_key(cls, key, blank, parent=None, move="", g=0, h=0, n=N):
+        s = cls.__new__(cls)
+        s.key = key
+        s.blank = blank
+        s.n = n
+        s.parent = parent
+        s.move = move
+        s.g = g
+        s.h = h
+        s.f = g + h
+        return s
+
+    @property
+    def board(self):
+        # built on demand; the search itself only touches the packed key
+        return decode(self.key, self.n)
+
     def __hash__(self):
-        return hash(tuple(tuple(row) for row in self.board))
+        return hash(self.key)
 
     def __eq__(self, other):
-        return isinstance(other, PuzzleState) and self.board == other.board
+        return isinstance(other, PuzzleState) and self.key == other.key
 
     def __lt__(self, other):
         return self.f < other.f
 
-    def is_goal(self, goal_board):
-        return self.board == goal_board
-
-    def get_neighbors(self):
-        neighbors = []
-        # locate empty tile (0)
-        x = y = None
-        for i in range(N):
-            for j in range(N):
-                if self.board[i][j] == 0:
-                    x, y = i, j
-                    break
-            if x is not None:
-                break
-
-        moves = {
-            'Up': (-1, 0),
-            'Down': (1, 0),
-            'Left': (0, -1),
-            'Right': (0, 1),
-        }
-        for name, (dx, dy) in moves.items():
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < N and 0 <= ny < N:
-                new_board = deepcopy(self.board)
-                new_board[x][y], new_board[nx][ny] = new_board[nx][ny], new_board[x][y]
-                neighbors.append(PuzzleState(new_board, self, name, self.g + 1))
-        return neighbors
+    def is_goal(self, goal):
+        if isinstance(goal, PuzzleState):
+            return self.key == goal.key
+        if isinstance(goal, int):
+            return self.key == goal
+        return self.key == encode(goal)
+
+    def get_neighbors(self, prune=False):
+        parent_move = MOVES.index(self.move) if prune and self.move else -1
+        return [PuzzleState.from_key(child, c, self, MOVES[code], self.g + 1, n=self.n)
+                for code, child, c in successors(self.key, self.blank, parent_move, move_table(self.n))]
+
+
+def replay(start, codes):
+    """Return the path of PuzzleStates obtained by applying move codes to start."""
+    path = [start]
+    table = move_table(start.n)
+    for code in codes:
+        prev = path[-1]
+        child, c = slide(prev.key, prev.blank, code, table)
+        path.append(PuzzleState.from_key(child, c, prev, MOVES[code], prev.g + 1, n=start.n))
+    return path
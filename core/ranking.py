@@ -0,0 +1,120 @@
+from math import isqrt
+
+from .moves import INVERSE, bits_for, move_table, slide
+
+FACT = [1]
+for _i in range(1, 26):
+    FACT.append(FACT[-1] * _i)
+
+_popcounts = {}
+
+
+def _popcount_table(size):
+    if size > 16:
+        return None
+    table = _popcounts.get(size)
+    if table is None:
+        table = bytearray(1 << size)
+        for m in range(1, 1 << size):
+            table[m] = table[m >> 1] + (m & 1)
+        _popcounts[size] = table
+    return table
+
+
+def rank(key, size=9):
+    """Lexicographic (Lehmer code) rank of a packed board among all size! boards."""
+    ones = _popcount_table(size)
+    bits = bits_for(isqrt(size))
+    mask = (1 << bits) - 1
+    r = 0
+    seen = 0
+    for i in range(size - 1, 0, -1):
+        t = key & mask
+        key >>= bits
+        # digit = how many still-unused tiles are smaller than t
+        below = seen & ((1 << t) - 1)
+        r += (t - (ones[below] if ones else bin(below).count('1'))) * FACT[i]
+        seen |= 1 << t
+    return r
+
+
+def unrank(r, size=9):
+    """Inverse of rank(): return the packed key."""
+    bits = bits_for(isqrt(size))
+    tiles = list(range(size))
+    key = 0
+    for i in range(size):
+        d, r = divmod(r, FACT[size - 1 - i])
+        key |= tiles.pop(d) << (bits * i)
+    return key
+
+
+class Bitset:
+    """Fixed-size set of small ints, one bit each."""
+    __slots__ = ('bits', 'count')
+
+    def __init__(self, size):
+        self.bits = bytearray((size + 7) >> 3)
+        self.count = 0
+
+    def __contains__(self, i):
+        return self.bits[i >> 3] >> (i & 7) & 1
+
+    def __len__(self):
+        return self.count
+
+    def add(self, i):
+        byte, bit = i >> 3, 1 << (i & 7)
+        if not self.bits[byte] & bit:
+            self.bits[byte] |= bit
+            self.count += 1
+
+    def nbytes(self):
+        return len(self.bits)
+
+
+def trace_moves(parent_moves, key, blank, start_key, size=9):
+    """Follow a rank-indexed parent-move table (move code + 1) from key back to start_key.
+
+    Returns the move codes in start -> key order.
+    """
+    table = move_table(isqrt(size))
+    codes = []
+    while key != start_key:
+        code = parent_moves[rank(key, size)] - 1
+        codes.append(code)
+        key, blank = slide(key, blank, INVERSE[code], table)
+    codes.reverse()
+    return codes
+
+
+def check_dense(size):
+    if size > 9:
+        raise ValueError("dense mode needs a board of at most 9 cells, got %d" % size)
+    return FACT[size]
+
+
+def partial_count(size, k):
+    """Number of placements of k distinct tiles on size cells (size! / (size - k)!)."""
+    return FACT[size] // FACT[size - k]
+
+
+def rank_partial(cells, size):
+    """Rank a tuple of k distinct cells among all partial_count(size, k) placements."""
+    r = 0
+    used = 0
+    for i, c in enumerate(cells):
+        # digit = how many still-free cells come before c
+        r = r * (size - i) + c - bin(used & ((1 << c) - 1)).count('1')
+        used |= 1 << c
+    return r
+
+
+def unrank_partial(r, size, k):
+    """Inverse of rank_partial(): return the list of k cells."""
+    digits = []
+    for i in range(k - 1, -1, -1):
+        r, d = divmod(r, size - i)
+        digits.append(d)
+    free = list(range(size))
+    return [free.pop(d) for d in reversed(digits)]
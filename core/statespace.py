@@ -0,0 +1,171 @@
+"""Layered BFS over a whole permutation state space (boards of at most 9 cells).
+
+Each of the size! permutation ranks has a 2-bit status, four to a byte
+(~90 KB for the 8-puzzle), instead of a frontier of state objects:
+
+    UNSEEN  not reached yet
+    OPEN    in the layer being expanded
+    NEXT    reached from that layer
+    CLOSED  expanded
+
+A layer is expanded a block of status bytes at a time. The OPEN ranks of a
+block are unranked into a (size, m) tile array, each legal move swaps two
+cells, and the children are ranked back, all as NumPy array operations.
+Children whose status is still UNSEEN become NEXT; when the layer is done a
+256-entry lookup turns every OPEN into CLOSED and every NEXT into OPEN.
+
+    from core.statespace import layered_bfs
+    result = layered_bfs(canonical_goal(8, 3), table=True)
+    result['layers']     # states per distance from the goal
+    result['table']      # core.distdb format, as distdb.build() returns
+
+Needs NumPy, which is otherwise not a dependency of this package.
+"""
+from math import isqrt
+
+import numpy as np
+
+from .moves import INVERSE, move_table
+from .ranking import FACT, check_dense
+from .utils import board_to_1d
+
+UNSEEN, OPEN, NEXT, CLOSED = 0, 1, 2, 3
+UNREACHED = 0xFF  # as in core.distdb
+BLOCK = 1 << 16  # status bytes (4 states each) expanded at a time
+
+_SHIFTS = np.array([0, 2, 4, 6], dtype=np.uint8)
+# one byte of four statuses -> the same byte after a layer: OPEN -> CLOSED, NEXT -> OPEN
+_ADVANCE = np.array([sum((0, CLOSED, OPEN, CLOSED)[(b >> s) & 3] << s for s in range(0, 8, 2))
+                     for b in range(256)], dtype=np.uint8)
+_INVERSE = np.array(INVERSE, dtype=np.uint8)
+
+
+def rank_all(tiles):
+    """Lexicographic ranks (as core.ranking.rank) of the m boards in a (size, m) tile array.
+
+    Boards are columns, so every step below works on contiguous rows of m tiles.
+    """
+    size, m = tiles.shape
+    ranks = np.zeros(m, dtype=np.int64)
+    digit = np.empty(m, dtype=np.uint8)
+    for i in range(size - 1):
+        # Lehmer digit: how many later cells hold a smaller tile
+        np.less(tiles[i + 1], tiles[i], out=digit)
+        for j in range(i + 2, size):
+            digit += tiles[j] < tiles[i]
+        ranks += digit * np.int64(FACT[size - 1 - i])
+    return ranks
+
+
+def unrank_all(ranks, size):
+    """(size, m) uint8 tile array of the boards with these ranks; inverse of rank_all()."""
+    ranks = np.asarray(ranks, dtype=np.int64)
+    tiles = np.empty((size, len(ranks)), dtype=np.uint8)
+    for i in range(size):
+        tiles[i], ranks = np.divmod(ranks, FACT[size - 1 - i])
+    # digits to tiles from the right: each digit is the tile's order among the cells after it
+    for i in range(size - 2, -1, -1):
+        for j in range(i + 1, size):
+            tiles[j] += tiles[j] >= tiles[i]
+    return tiles
+
+
+def statuses(packed, ranks):
+    """2-bit status of each rank in a packed status array."""
+    return (packed[ranks >> 2] >> ((ranks & 3) << 1).astype(np.uint8)) & 3
+
+
+def _mark(packed, ranks, status):
+    # ranks are distinct and UNSEEN, so OR-ing the status in is enough
+    np.bitwise_or.at(packed, ranks >> 2, (status << ((ranks & 3) << 1)).astype(np.uint8))
+
+
+def _destinations(n):
+    """dest[code, blank]: the blank's new cell after move code, or -1 where illegal."""
+    dest = np.full((len(INVERSE), n * n), -1, dtype=np.int64)
+    for blank, row in enumerate(move_table(n).moves):
+        for code, c, _, _ in row:
+            dest[code, blank] = c
+    return dest
+
+
+def _expand(ranks, size, dest):
+    """Ranks of all children of the given ranks, and the move code that made each."""
+    tiles = unrank_all(ranks, size)
+    blanks = tiles.argmin(axis=0)
+    children, codes = [], []
+    for code in range(len(dest)):
+        cells = dest[code][blanks]
+        legal = np.flatnonzero(cells >= 0)
+        child = tiles.take(legal, axis=1)  # C order, unlike tiles[:, legal]
+        at = np.arange(len(legal))
+        child[blanks[legal], at] = child[cells[legal], at]
+        child[cells[legal], at] = 0
+        children.append(child)
+        codes.append(np.full(len(legal), code, dtype=np.uint8))
+    return rank_all(np.concatenate(children, axis=1)), np.concatenate(codes)
+
+
+def layered_bfs(goal_board, table=False, block=BLOCK):
+    """Breadth-first enumeration of every state reachable from goal_board.
+
+    Returns a dict with
+        layers          states at each distance 0, 1, ... from the goal
+        states          reachable states (sum of layers)
+        max_depth       largest distance (31 for the 8-puzzle)
+        antipodes       ranks of the states at max_depth
+        expanded, generated
+                        states expanded and children generated (every legal move)
+        mean_branching  generated / expanded: legal moves per state, averaged
+                        over the whole space
+        table           with table=True, a bytearray in core.distdb format:
+                        (distance << 2) | move code towards the goal per rank,
+                        UNREACHED for the other parity class; else None
+    """
+    goal = board_to_1d(goal_board)
+    size = len(goal)
+    states = check_dense(size)
+    dest = _destinations(isqrt(size))
+    packed = np.zeros((states + 3) // 4, dtype=np.uint8)
+    goal_rank = rank_all(np.array([goal], dtype=np.uint8).T)
+    _mark(packed, goal_rank, OPEN)
+    dist = None
+    if table:
+        dist = np.full(states, UNREACHED, dtype=np.uint8)
+        dist[goal_rank] = 0
+
+    layers = [1]
+    generated = 0
+    while True:
+        depth = len(layers)
+        reached = 0
+        for start in range(0, len(packed), block):
+            fields = (packed[start:start + block, None] >> _SHIFTS) & 3
+            frontier = np.flatnonzero(fields.ravel() == OPEN) + 4 * start
+            if not len(frontier):
+                continue
+            children, codes = _expand(frontier, size, dest)
+            generated += len(children)
+            fresh = statuses(packed, children) == UNSEEN
+            children, first = np.unique(children[fresh], return_index=True)
+            _mark(packed, children, NEXT)
+            if dist is not None:
+                # the way back towards the goal undoes the move that reached the child
+                dist[children] = (depth << 2) | _INVERSE[codes[fresh][first]]
+            reached += len(children)
+        if not reached:
+            break
+        packed = _ADVANCE[packed]
+        layers.append(reached)
+
+    fields = ((packed[:, None] >> _SHIFTS) & 3).ravel()[:states]
+    return {
+        'layers': layers,
+        'states': sum(layers),
+        'max_depth': len(layers) - 1,
+        'antipodes': np.flatnonzero(fields == OPEN).tolist(),
+        'expanded': sum(layers),
+        'generated': generated,
+        'mean_branching': generated / sum(layers),
+        'table': bytearray(dist.tobytes()) if dist is not None else None,
+    }
@@ -0,0 +1,100 @@
+"""Dihedral symmetries of the n x n board.
+
+Rotating or reflecting start and goal together gives a problem with the
+same solution length; its moves are the original moves turned the same way.
+canonicalize() picks one representative per class of up to 8 problems, so
+tables and caches keyed on it store each class once.
+"""
+from functools import lru_cache
+
+from .moves import _DELTAS
+from .puzzle_state import encode
+from .utils import board_to_1d, board_to_2d, relabel_to_canonical
+
+# (r, c) -> transformed (r, c) on an n x n board
+_TRANSFORMS = (
+    lambda r, c, m: (r, c),           # identity
+    lambda r, c, m: (c, m - r),       # rotate 90 clockwise
+    lambda r, c, m: (m - r, m - c),   # rotate 180
+    lambda r, c, m: (m - c, r),       # rotate 270
+    lambda r, c, m: (r, m - c),       # mirror left-right
+    lambda r, c, m: (m - r, c),       # mirror top-bottom
+    lambda r, c, m: (c, r),           # transpose
+    lambda r, c, m: (m - c, m - r),   # anti-transpose
+)
+IDENTITY = 0
+COUNT = len(_TRANSFORMS)
+
+
+@lru_cache(maxsize=None)
+def cell_map(n, t):
+    """cell_map(n, t)[i] is the cell that cell i moves to under transform t."""
+    m = n - 1
+    out = []
+    for i in range(n * n):
+        r, c = _TRANSFORMS[t](*divmod(i, n), m)
+        out.append(r * n + c)
+    return tuple(out)
+
+
+@lru_cache(maxsize=None)
+def inverse(t):
+    forward = cell_map(3, t)
+    for u in range(COUNT):
+        if all(cell_map(3, u)[forward[i]] == i for i in range(9)):
+            return u
+    raise ValueError("transform %d has no inverse" % t)
+
+
+@lru_cache(maxsize=None)
+def move_map(t):
+    """move_map(t)[code] is the move code that `code` becomes under transform t."""
+    origin = _TRANSFORMS[t](0, 0, 0)
+    out = []
+    for dr, dc in _DELTAS:
+        r, c = _TRANSFORMS[t](dr, dc, 0)
+        out.append(_DELTAS.index((r - origin[0], c - origin[1])))
+    return tuple(out)
+
+
+def transform_board(board, t):
+    """Return the 2D board rotated/reflected by transform t."""
+    n = len(board)
+    cells = cell_map(n, t)
+    flat = board_to_1d(board)
+    out = [0] * (n * n)
+    for i, tile in enumerate(flat):
+        out[cells[i]] = tile
+    return board_to_2d(out, n)
+
+
+def canonicalize(start_board, goal_board):
+    """Return (start, goal, t): the class representative of the problem and the transform to it.
+
+    The representative is relabelled so its goal is canonical_goal(blank);
+    among the transforms, the one giving the largest goal blank cell and
+    then the smallest packed start wins.
+    """
+    best = None
+    for t in range(COUNT):
+        start, goal = relabel_to_canonical(transform_board(start_board, t), transform_board(goal_board, t))
+        rank = (-board_to_1d(goal).index(0), encode(start))
+        if best is None or rank < best[0]:
+            best = (rank, start, goal, t)
+    return best[1], best[2], best[3]
+
+
+def moves_to_frame(codes, t):
+    """Map move codes of the original problem to the problem transformed by t."""
+    mapping = move_map(t)
+    return [mapping[c] for c in codes]
+
+
+def moves_from_frame(codes, t):
+    """Map move codes of the problem transformed by t back to the original problem."""
+    return moves_to_frame(codes, inverse(t))
+
+
+def blank_classes(n):
+    """Representative goal blank cells, one per symmetry class (largest cell of each)."""
+    return sorted({max(cell_map(n, t)[b] for t in range(COUNT)) for b in range(n * n)})
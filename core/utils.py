@@ -10,24 +10,50 @@ def board_to_1d(grid):
         flat.extend(row)
     return flat
 
+def _parity(flat, N):
+    tiles = [t for t in flat if t]
+    inversions = 0
+    for i in range(len(tiles)):
+        for j in range(i + 1, len(tiles)):
+            if tiles[i] > tiles[j]:
+                inversions += 1
+    if N % 2 == 0:
+        # on even widths a vertical slide passes N-1 tiles (odd), so the blank row counts too
+        inversions += flat.index(0) // N
+    return inversions % 2
+
+def is_solvable(flat, N=3, goal=None):
+    """True if flat can reach goal (default: 1..N*N-1 then blank)."""
+    if goal is None:
+        goal = list(range(1, N * N)) + [0]
+    return _parity(flat, N) == _parity(goal, N)
+
+def canonical_goal(blank, N=3):
+    """Goal with tiles 1..N*N-1 in reading order and the blank at cell `blank`."""
+    flat = list(range(1, N * N))
+    flat.insert(blank, 0)
+    return board_to_2d(flat, N)
+
+def relabel_to_canonical(start_board, goal_board):
+    """Rename tiles so goal_board becomes canonical_goal(); moves are unchanged.
+
+    Returns (relabelled start, canonical goal).
+    """
+    N = len(goal_board)
+    goal = board_to_1d(goal_board)
+    canon = board_to_1d(canonical_goal(goal.index(0), N))
+    names = dict(zip(goal, canon))
+    return board_to_2d([names[t] for t in board_to_1d(start_board)], N), board_to_2d(canon, N)
+
 def manhattan_distance(state, goal_board, N=3):
-    goal_pos = {}
-    for i in range(N):
-        for j in range(N):
-            goal_pos[goal_board[i][j]] = (i, j)
-    dist = 0
-    for i in range(N):
-        for j in range(N):
-            tile = state.board[i][j]
-            if tile != 0:
-                gx, gy = goal_pos[tile]
-                dist += abs(i - gx) + abs(j - gy)
-    return dist
-
-def make_stats(solution_path, nodes_expanded, visited_states, max_frontier, start_time):
+    from .heuristics import manhattan
+    return manhattan(goal_board)(state)
+
+def make_stats(solution_path, nodes_expanded, visited_states, max_frontier, start_time, **extra):
+    """Common stats dict; solver-specific fields are passed as keyword arguments."""
     exec_time = time.time() - start_time
     if solution_path:
-        return {
+        stats = {
             'solution_found': True,
             'path_length': len(solution_path) - 1,
             'nodes_expanded': nodes_expanded,
@@ -36,7 +62,7 @@ def make_stats(solution_path, nodes_expanded, visited_states, max_frontier, star
             'execution_time': exec_time,
         }
     else:
-        return {
+        stats = {
             'solution_found': False,
             'path_length': 0,
             'nodes_expanded': nodes_expanded,
@@ -44,3 +70,7 @@ def make_stats(solution_path, nodes_expanded, visited_states, max_frontier, star
             'max_frontier': max_frontier,
             'execution_time': exec_time,
         }
+    stats.update(extra)
+    # solvers that searched pass their estimate; trivial answers hold nothing
+    stats.setdefault('peak_memory_bytes', 0)
+    return stats
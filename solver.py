@@ -0,0 +1,242 @@
+"""Headless command line: solve, benchmark and generate boards without the GUI.
+
+    python3 -m solver solve "8 6 7 2 5 4 3 0 1" -a astar --heuristic linear_conflict
+    python3 -m solver gen --count 100 --width 4 --walk 40 > boards.txt
+    python3 -m solver bench -a astar idastar --count 20 --seed 1
+    python3 -m solver --import-times solve "1 2 3 4 5 6 0 7 8"
+
+Never imports tkinter; algorithm modules are imported by name on first use.
+"""
+import time
+
+_t0 = time.perf_counter()
+_import_times = []  # (module, seconds) for everything loaded through _load()
+
+
+def _load(name):
+    """Import a module by name, recording how long it took."""
+    import importlib
+    import sys
+    if name in sys.modules:
+        return sys.modules[name]
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    _import_times.append((name, time.perf_counter() - start))
+    return module
+
+
+def random_board(n, rng, walk=0):
+    """A random solvable flat board for the default goal.
+
+    walk > 0 scrambles the goal with that many random non-undoing slides
+    (shallow, controllable depth); walk == 0 draws uniformly from all
+    solvable boards.
+    """
+    goal = list(range(1, n * n)) + [0]
+    if walk:
+        moves = _load('core.moves')
+        table = moves.move_table(n)
+        board = goal[:]
+        blank, last = n * n - 1, -1
+        for _ in range(walk):
+            options = [(code, c) for code, c, _, _ in table.moves[blank] if last < 0 or code != moves.INVERSE[last]]
+            last, c = rng.choice(options)
+            board[blank], board[c] = board[c], 0
+            blank = c
+        return board
+    board = goal[:]
+    rng.shuffle(board)
+    if not _load('core.utils').is_solvable(board, n, goal):
+        # swapping two tiles flips the permutation parity
+        i, j = [k for k, t in enumerate(board) if t][:2]
+        board[i], board[j] = board[j], board[i]
+    return board
+
+
+PROFILED = ('astar', 'ucs', 'bfs')
+# command-line options that only some solvers accept, as (args attribute, solve() keyword, algorithms)
+SOLVER_OPTIONS = (
+    ('heuristic', 'heuristic', ('astar', 'arastar', 'hdastar', 'idastar')),
+    ('deadline', 'deadline', ('arastar',)),
+    ('weight', 'weight', ('arastar',)),
+    ('workers', 'workers', ('hdastar',)),
+    ('tt_size', 'tt_size', ('dfs', 'idastar')),
+)
+
+
+def cmd_solve(args):
+    if args.trace or args.folded:
+        return _solve_profiled(args)
+    batch = _load('tools.batch_solve')
+    ident, flat = batch.parse_line(args.board)
+    goal = batch.parse_line(args.goal)[1] if args.goal else None
+    _load('algorithms.' + args.algorithm)
+    result = batch.solve_one(args.algorithm, flat, goal, args.timeout, _options(args, args.algorithm), args.cache)
+    if args.json:
+        import json
+        print(json.dumps(result))
+        return 0 if result.get('solution_found') else 1
+    if 'error' in result:
+        print("error: %s" % result['error'])
+        return 1
+    if not result['solution_found']:
+        print("memory budget exceeded" if result.get('memory_budget_exceeded') else "no solution found")
+        return 1
+    print(result['moves'] or "(already solved)")
+    print("%d moves, %s nodes expanded, %.4fs, peak ~%d KB%s" % (
+        result['path_length'], format(result['nodes_expanded'], ','), result['execution_time'],
+        result['peak_memory_bytes'] // 1024, " (via %s fallback)" % result['fallback'] if 'fallback' in result else ''))
+    if result.get('suboptimality_bound'):
+        print("within %.3fx of optimal" % result['suboptimality_bound'])
+    return 0
+
+
+def _solve_profiled(args):
+    import json
+    import sys
+    if args.algorithm not in PROFILED:
+        print("error: --trace/--folded support %s" % ', '.join(PROFILED))
+        return 1
+    batch = _load('tools.batch_solve')
+    probe = _load('core.instrument').SearchProbe(trace=bool(args.trace))
+    ident, flat = batch.parse_line(args.board)
+    n = _load('math').isqrt(len(flat))
+    goal = batch.parse_line(args.goal)[1] if args.goal else list(range(1, n * n)) + [0]
+    utils = _load('core.utils')
+    path, stats = _load('algorithms.' + args.algorithm).solve(
+        utils.board_to_2d(flat, n), utils.board_to_2d(goal, n), probe=probe, **_options(args, args.algorithm))
+    if args.trace:
+        probe.write_chrome_trace(args.trace)
+    if args.folded:
+        probe.write_collapsed(args.folded)
+    sys.stderr.write(json.dumps(probe.summary()) + '\n')
+    print(''.join(batch.MOVE_LETTERS[s.move] for s in path[1:]) if stats['solution_found'] else "no solution found")
+    return 0 if stats['solution_found'] else 1
+
+
+def cmd_gen(args):
+    import random
+    rng = random.Random(args.seed)
+    for _ in range(args.count):
+        print(' '.join(map(str, random_board(args.width, rng, args.walk))))
+    return 0
+
+
+def cmd_bench(args):
+    import random
+    batch = _load('tools.batch_solve')
+    rng = random.Random(args.seed)
+    boards = [random_board(args.width, rng, args.walk) for _ in range(args.count)]
+    print("%-10s %7s %9s %12s %10s" % ('algorithm', 'solved', 'avg len', 'avg nodes', 'avg time'))
+    for algorithm in args.algorithm:
+        _load('algorithms.' + algorithm)
+        results = [batch.solve_one(algorithm, b, None, args.timeout, _options(args, algorithm)) for b in boards]
+        solved = [r for r in results if r.get('solution_found')]
+        errors = [r['error'] for r in results if 'error' in r]
+        k = len(solved) or 1
+        print("%-10s %3d/%-3d %9.1f %12s %9.4fs" % (
+            algorithm, len(solved), len(results),
+            sum(r['path_length'] for r in solved) / k,
+            format(sum(r['nodes_expanded'] for r in solved) // k, ','),
+            sum(r['execution_time'] for r in solved) / k))
+        if errors:
+            print("%-10s %d failed, e.g. %s" % ('', len(errors), errors[0]))
+    return 0
+
+
+def _options(args, algorithm):
+    """solve() keywords for one algorithm; options it does not take are left out."""
+    options = {}
+    for name, keyword, algorithms in SOLVER_OPTIONS:
+        value = getattr(args, name, None)
+        if value is not None and algorithm in algorithms:
+            options[keyword] = value
+    if args.memory_budget:
+        options.update(memory_budget=int(args.memory_budget * 2 ** 20), on_budget=args.on_budget)
+    return options
+
+
+def _add_tt_argument(p):
+    p.add_argument('--tt-size', type=int, default=None, metavar='ENTRIES',
+                   help="dfs/idastar: transposition table entries (default: dfs.TT_SIZE for dfs, none for idastar)")
+
+
+def _add_budget_arguments(p):
+    p.add_argument('--memory-budget', type=float, default=None, metavar='MB',
+                   help="estimated search memory allowed, in MiB")
+    p.add_argument('--on-budget', default='abort', choices=('abort', 'fallback'),
+                   help="over budget: stop, or finish with IDA* (default: abort)")
+
+
+def build_parser():
+    import argparse
+    parser = argparse.ArgumentParser(prog='python -m solver', description="Headless N-puzzle solver.")
+    parser.add_argument('--import-times', action='store_true',
+                        help="print module import times to stderr on exit")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    algos = ('bfs', 'bibfs', 'dfs', 'ucs', 'astar', 'arastar', 'hdastar', 'idastar', 'lookup')
+    p = sub.add_parser('solve', help="solve one board and print its moves")
+    p.add_argument('board', help='tiles, e.g. "1 2 3 4 5 6 0 7 8" or a JSON list')
+    p.add_argument('-a', '--algorithm', default='astar', choices=algos)
+    p.add_argument('--heuristic', default=None, help="heuristic name for astar/arastar/hdastar/idastar")
+    p.add_argument('--goal', default=None, help="goal board (default: 1..n*n-1 then blank)")
+    p.add_argument('--deadline', type=float, default=None, help="arastar: return the best path after this many seconds")
+    p.add_argument('--weight', type=float, default=None, help="arastar: initial heuristic weight (default 3)")
+    p.add_argument('--workers', type=int, default=None, help="hdastar: worker processes (default: all cores)")
+    p.add_argument('--timeout', type=float, default=None, help="give up after this many seconds")
+    p.add_argument('--json', action='store_true', help="print the result as one JSON line")
+    p.add_argument('--cache', default=None, help="SQLite solution cache file")
+    p.add_argument('--trace', default=None, help="profile the search and write a Chrome trace (astar, ucs, bfs)")
+    p.add_argument('--folded', default=None, help="profile the search and write collapsed stacks for flamegraphs")
+    _add_tt_argument(p)
+    _add_budget_arguments(p)
+    p.set_defaults(func=cmd_solve)
+
+    p = sub.add_parser('gen', help="print random solvable boards, one per line")
+    p.add_argument('--count', type=int, default=10)
+    p.add_argument('--width', type=int, default=3)
+    p.add_argument('--walk', type=int, default=0,
+                   help="scramble by this many random slides instead of a uniform draw")
+    p.add_argument('--seed', type=int, default=None)
+    p.set_defaults(func=cmd_gen)
+
+    p = sub.add_parser('bench', help="solve generated boards with each algorithm and print averages")
+    p.add_argument('-a', '--algorithm', nargs='+', default=['astar'], choices=algos)
+    p.add_argument('--heuristic', default=None, help="heuristic name for astar/arastar/hdastar/idastar")
+    p.add_argument('--count', type=int, default=10)
+    p.add_argument('--width', type=int, default=3)
+    p.add_argument('--walk', type=int, default=0)
+    p.add_argument('--seed', type=int, default=0)
+    p.add_argument('--timeout', type=float, default=None, help="seconds per board")
+    _add_tt_argument(p)
+    _add_budget_arguments(p)
+    p.set_defaults(func=cmd_bench)
+    return parser
+
+
+def report_import_times(out):
+    total = time.perf_counter() - _t0
+    for name, seconds in _import_times:
+        out.write("import %-24s %7.2f ms\n" % (name, seconds * 1000))
+    out.write("imports total                   %7.2f ms\n" % (sum(s for _, s in _import_times) * 1000))
+    out.write("wall time since solver loaded   %7.2f ms\n" % (total * 1000))
+
+
+def main(argv=None):
+    import sys
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == 'solve':
+        for name, _, algorithms in SOLVER_OPTIONS:
+            if getattr(args, name, None) is not None and args.algorithm not in algorithms:
+                parser.error("--%s only applies to %s" % (name.replace('_', '-'), ', '.join(algorithms)))
+    try:
+        return args.func(args)
+    finally:
+        if args.import_times:
+            report_import_times(sys.stderr)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
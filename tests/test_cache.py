@@ -0,0 +1,52 @@
+from algorithms import arastar, astar
+from core.cache import SolutionCache
+
+from .test_solvers import GOAL, board
+
+
+def test_hit_replays_the_cached_moves():
+    cache = SolutionCache()
+    start = board("1 0 2 4 6 3 7 5 8")
+    path, stats = cache.solve('astar', start, GOAL)
+    again, hit = cache.solve('astar', start, GOAL)
+    assert not stats['cache_hit'] and hit['cache_hit']
+    assert [s.key for s in again] == [s.key for s in path]
+    # the same arrangement under other tile names shares the entry
+    names = {t: (t * 5) % 9 for t in range(9)}
+    renamed = [[names[t] for t in row] for row in start]
+    goal = [[names[t] for t in row] for row in GOAL]
+    path, stats = cache.solve('astar', renamed, goal)
+    assert stats['cache_hit'] and path[-1].board == goal
+
+
+def test_failed_searches_are_not_stored(tmp_path):
+    cache = SolutionCache(path=str(tmp_path / 'cache.db'))
+    unsolvable = board("2 1 3 4 5 6 7 8 0")
+    for _ in range(2):
+        path, stats = cache.solve('astar', unsolvable, GOAL)
+        assert path == [] and not stats['cache_hit']
+    assert cache.misses == 2
+    cache.close()
+
+
+def test_searches_over_budget_are_not_stored():
+    cache = SolutionCache()
+    start = board("1 0 2 3 4 5 6 7 8")
+    for _ in range(2):
+        path, stats = cache.solve('bfs', start, GOAL, memory_budget=1 << 10, on_budget='fallback')
+        assert stats['memory_budget_exceeded'] and not stats['cache_hit']
+        assert len(path) == 22
+
+
+def test_searches_cut_by_a_deadline_are_not_stored(monkeypatch):
+    def cut_short(start, goal, **options):
+        path, stats = astar.solve(start, goal)
+        return path, dict(stats, deadline_reached=True)
+
+    monkeypatch.setattr(arastar, 'solve', cut_short)
+    cache = SolutionCache()
+    start = board("1 0 2 3 4 5 6 7 8")
+    for _ in range(2):
+        path, stats = cache.solve('arastar', start, GOAL, deadline=1.0)
+        assert stats['solution_found'] and not stats['cache_hit']
+    assert cache.misses == 2
@@ -0,0 +1,44 @@
+from core import heuristics
+from core.heuristics import ManhattanHeuristic, get_heuristic, register, usable
+
+GOAL = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+
+
+def test_compiled_heuristics_are_bounded():
+    for blank in range(9):
+        for name in ('manhattan', 'misplaced', 'linear_conflict'):
+            goal = [t for row in GOAL for t in row if t]
+            goal.insert(blank, 0)
+            get_heuristic(name, [goal[i:i + 3] for i in range(0, 9, 3)])
+    assert len(heuristics._compiled) <= heuristics.COMPILED_SIZE
+    h = get_heuristic('manhattan', GOAL)
+    assert get_heuristic('manhattan', GOAL) is h
+
+
+def test_register_replaces_compiled_heuristics():
+    class Zero(ManhattanHeuristic):
+        __slots__ = ()
+
+        def __call__(self, state):
+            return 0
+
+    try:
+        register('test_zero', ManhattanHeuristic)
+        first = get_heuristic('test_zero', GOAL)
+        register('test_zero', Zero)
+        assert isinstance(get_heuristic('test_zero', GOAL), Zero)
+        assert get_heuristic('test_zero', GOAL) is not first
+    finally:
+        del heuristics.HEURISTICS['test_zero']
+
+
+def test_usable_by_width():
+    assert usable('manhattan', 5)
+    assert usable('walking_distance', 4)
+    assert not usable('walking_distance', 5)
+
+
+def test_pdb_needs_its_tables(tmp_path, monkeypatch):
+    monkeypatch.setattr('core.patterndb.DEFAULT_DIR', str(tmp_path))
+    assert not usable('pdb', 3)
+    assert not usable('pdb663', 4)
@@ -0,0 +1,36 @@
+import pytest
+
+from algorithms import astar, bfs, ucs
+from core.control import SearchCancelled, SearchControl
+from core.instrument import SearchProbe
+
+from .test_solvers import BOARDS, GOAL, board
+
+
+@pytest.mark.parametrize('solve', [astar.solve, bfs.solve, ucs.solve])
+def test_counts_restart_with_each_search(solve):
+    events = []
+    probe = SearchProbe(on_event=lambda name, n: events.append((name, n)))
+    start = board(BOARDS[-1])
+    solve(start, GOAL, probe=probe)
+    first = dict(probe.counts)
+    assert first['duplicate'] == sum(n for name, n in events if name == 'duplicate') > 0
+    # every generated child is either pushed or rejected as a duplicate
+    assert first['generate'] == first['push'] + first['duplicate']
+    solve(start, GOAL, probe=probe)
+    assert probe.counts == first
+
+
+def test_cancelled_search_ends_the_probe():
+    probe = SearchProbe()
+    control = SearchControl()
+    control.cancel()
+    with pytest.raises(SearchCancelled):
+        bfs.solve(board(BOARDS[-1]), GOAL, control=control, probe=probe)
+    # the clock stopped with the search
+    assert probe.total_ns() == probe.total_ns() > 0
+
+
+def test_dense_mode_rejects_a_probe():
+    with pytest.raises(ValueError):
+        bfs.solve(board(BOARDS[-1]), GOAL, dense=True, probe=SearchProbe())
@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+from algorithms import astar, bfs, idastar
+from core import patterndb
+from core.moves import move_table, successors
+from core.patterndb import AdditivePDBHeuristic
+from core.puzzle_state import encode
+from core.ranking import rank_partial
+
+from .test_solvers import BOARDS, GOAL, board
+
+SPLIT = patterndb.SPLITS[(3, '44')]
+
+
+@pytest.fixture(scope='module')
+def tables(tmp_path_factory):
+    directory = str(tmp_path_factory.mktemp('pdb'))
+    built = []
+    for cells in SPLIT:
+        table = patterndb.build(3, cells)
+        patterndb.write(patterndb.table_path(3, cells, directory), table, 3, cells)
+        built.append((cells, table))
+    return directory, built
+
+
+def test_tables_exist(tables):
+    directory, _ = tables
+    assert patterndb.tables_exist(3, '44', directory)
+    assert not patterndb.tables_exist(3, '44', directory + '/missing')
+    assert not patterndb.tables_exist(3, '78', directory)
+
+
+def test_lookups_match_a_direct_build(tables):
+    directory, built = tables
+    h = AdditivePDBHeuristic(GOAL, '44', directory)
+    flat_goal = [t for row in GOAL for t in row]
+    for text in BOARDS:
+        flat = [int(t) for t in text.split()]
+        expected = sum(table[rank_partial([flat.index(flat_goal[c]) for c in cells], 9)]
+                       for cells, table in built)
+        assert h(encode(board(text))) == expected
+
+
+def test_delta_matches_full_evaluation(tables):
+    h = AdditivePDBHeuristic(GOAL, '44', tables[0])
+    rnd = random.Random(1)
+    key, blank = encode(GOAL), 8
+    value = h(key)
+    for _ in range(200):
+        code, child, c = rnd.choice(list(successors(key, blank, -1)))
+        tile = (child >> (4 * blank)) & 15
+        value = h.delta(value, tile, c, blank, child)
+        assert value == h(child)
+        key, blank = child, c
+
+
+@pytest.mark.parametrize('text', BOARDS)
+@pytest.mark.parametrize('solve', [astar.solve, idastar.solve])
+def test_search_with_pdb_is_optimal(tables, solve, text):
+    h = AdditivePDBHeuristic(GOAL, '44', tables[0])
+    start = board(text)
+    assert solve(start, GOAL, heuristic=h)[1]['path_length'] == bfs.solve(start, GOAL)[1]['path_length']
+
+
+def test_mirrored_group_matches_its_own_table(tmp_path, monkeypatch):
+    # (4, 8) is the transpose of (1, 2), so only the first table is written
+    monkeypatch.setitem(patterndb.SPLITS, (4, 'test'), ((1, 2), (4, 8)))
+    directory = str(tmp_path)
+    patterndb.write(patterndb.table_path(4, (1, 2), directory), patterndb.build(4, (1, 2)), 4, (1, 2))
+    assert patterndb.tables_exist(4, 'test', directory)
+    direct = [((1, 2), patterndb.build(4, (1, 2))), ((4, 8), patterndb.build(4, (4, 8)))]
+    goal = [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12], [13, 14, 15, 0]]
+    flat_goal = [t for row in goal for t in row]
+    h = AdditivePDBHeuristic(goal, 'test', directory)
+    rnd = random.Random(2)
+    key, blank = encode(goal), 15
+    value = h(key)
+    for _ in range(300):
+        code, child, c = rnd.choice(list(successors(key, blank, -1, move_table(4))))
+        value = h.delta(value, (child >> (4 * blank)) & 15, c, blank, child)
+        flat = [(child >> (4 * i)) & 15 for i in range(16)]
+        expected = sum(table[rank_partial([flat.index(flat_goal[g]) for g in cells], 16)]
+                       for cells, table in direct)
+        assert value == h(child) == expected
+        key, blank = child, c
@@ -0,0 +1,35 @@
+from itertools import permutations
+from math import isqrt
+
+from core.puzzle_state import encode
+from core.ranking import FACT, partial_count, rank, rank_partial, unrank, unrank_partial
+
+
+def pack(flat):
+    n = isqrt(len(flat))
+    return encode([list(flat[i:i + n]) for i in range(0, len(flat), n)])
+
+
+def test_rank_is_lexicographic_order():
+    for r, flat in enumerate(permutations(range(4))):
+        assert rank(pack(flat), 4) == r
+
+
+def test_unrank_inverts_rank():
+    for r in range(FACT[4]):
+        assert rank(unrank(r, 4), 4) == r
+    for r in range(0, FACT[9], 997):
+        key = unrank(r, 9)
+        assert rank(key, 9) == r
+        assert unrank(rank(key, 9), 9) == key
+    assert rank(unrank(FACT[9] - 1, 9), 9) == FACT[9] - 1
+    for r in range(0, FACT[16], FACT[16] // 1009):
+        assert rank(unrank(r, 16), 16) == r
+
+
+def test_unrank_partial_inverts_rank_partial():
+    for size, k in ((9, 4), (16, 3)):
+        for r in range(partial_count(size, k)):
+            cells = unrank_partial(r, size, k)
+            assert len(set(cells)) == k
+            assert rank_partial(cells, size) == r
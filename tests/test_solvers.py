@@ -0,0 +1,71 @@
+import pytest
+
+from algorithms import arastar, astar, bfs, bibfs, dfs, hdastar, idastar, lookup, ucs
+from core import distdb
+
+GOAL = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+# optimal lengths 0, 1, 5, 9, 13, 17 and 21
+BOARDS = [
+    "1 2 3 4 5 6 7 8 0",
+    "1 2 3 4 5 0 7 8 6",
+    "1 0 2 4 6 3 7 5 8",
+    "1 0 2 4 5 6 7 3 8",
+    "1 0 2 3 6 8 4 7 5",
+    "1 0 2 3 6 5 4 8 7",
+    "1 0 2 3 4 5 6 7 8",
+]
+
+
+def board(text, n=3):
+    flat = [int(t) for t in text.split()]
+    return [flat[i:i + n] for i in range(0, n * n, n)]
+
+
+@pytest.fixture(scope='module')
+def table_dir(tmp_path_factory):
+    directory = str(tmp_path_factory.mktemp('distdb'))
+    distdb.write(distdb.table_path(8, directory), distdb.build(8), 8)
+    return directory
+
+
+SOLVERS = {
+    'arastar': arastar.solve,
+    'astar': astar.solve,
+    'bibfs': bibfs.solve,
+    'dfs': dfs.solve,
+    'hdastar': lambda start, goal: hdastar.solve(start, goal, workers=2),
+    'idastar': idastar.solve,
+    'idastar tt': lambda start, goal: idastar.solve(start, goal, tt_size=1 << 12),
+    'ucs': ucs.solve,
+    'bfs dense': lambda start, goal: bfs.solve(start, goal, dense=True),
+    'ucs dense': lambda start, goal: ucs.solve(start, goal, dense=True),
+}
+
+
+@pytest.mark.parametrize('text', BOARDS)
+@pytest.mark.parametrize('name', sorted(SOLVERS))
+def test_path_length_matches_bfs(name, text):
+    start = board(text)
+    expected = bfs.solve(start, GOAL)[1]['path_length']
+    path, stats = SOLVERS[name](start, GOAL)
+    assert stats['solution_found']
+    assert stats['path_length'] == expected == len(path) - 1
+    assert path[-1].board == GOAL
+
+
+@pytest.mark.parametrize('text', BOARDS)
+def test_lookup_matches_bfs(table_dir, text):
+    start = board(text)
+    path, stats = lookup.solve(start, GOAL, table_dir=table_dir)
+    assert stats['path_length'] == bfs.solve(start, GOAL)[1]['path_length']
+    assert path[-1].board == GOAL
+
+
+@pytest.mark.parametrize('text', BOARDS[3:])
+def test_arastar_bounds_hold(text):
+    start = board(text)
+    optimum = bfs.solve(start, GOAL)[1]['path_length']
+    stats = arastar.solve(start, GOAL, weight=5.0)[1]
+    assert stats['suboptimality_bound'] == 1.0
+    for solution in stats['solutions']:
+        assert optimum <= solution['path_length'] <= solution['suboptimality_bound'] * optimum
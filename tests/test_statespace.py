@@ -0,0 +1,27 @@
+import pytest
+
+from algorithms import bfs
+from core.puzzle_state import encode
+from core.ranking import rank
+
+from .test_solvers import BOARDS, GOAL, board
+
+statespace = pytest.importorskip('core.statespace')
+
+
+@pytest.fixture(scope='module')
+def result():
+    return statespace.layered_bfs(GOAL, table=True)
+
+
+def test_layers_cover_the_reachable_half(result):
+    assert result['states'] == 181440
+    assert result['max_depth'] == 31
+    assert len(result['antipodes']) == 2
+
+
+@pytest.mark.parametrize('text', BOARDS)
+def test_table_distances_match_bfs(result, text):
+    start = board(text)
+    expected = bfs.solve(start, GOAL)[1]['path_length']
+    assert result['table'][rank(encode(start), 9)] >> 2 == expected
@@ -0,0 +1,24 @@
+import pytest
+
+from algorithms import astar, bfs
+from core.symmetry import COUNT, canonicalize, transform_board
+
+from .test_solvers import BOARDS, GOAL, board
+
+
+@pytest.mark.parametrize('text', BOARDS[2:])
+def test_symmetric_variants_have_the_same_length(text):
+    start = board(text)
+    expected = bfs.solve(start, GOAL)[1]['path_length']
+    for t in range(COUNT):
+        variant, goal = transform_board(start, t), transform_board(GOAL, t)
+        path, stats = astar.solve(variant, goal)
+        assert stats['path_length'] == expected
+        assert path[-1].board == goal
+
+
+def test_variants_share_a_representative():
+    start = board(BOARDS[-1])
+    first = canonicalize(start, GOAL)[:2]
+    for t in range(COUNT):
+        assert canonicalize(transform_board(start, t), transform_board(GOAL, t))[:2] == first
@@ -0,0 +1,26 @@
+from core.utils import is_solvable
+
+GOAL_4 = list(range(1, 16)) + [0]
+
+
+def test_odd_width_counts_inversions_only():
+    assert is_solvable([1, 2, 3, 4, 5, 6, 7, 8, 0])
+    assert not is_solvable([2, 1, 3, 4, 5, 6, 7, 8, 0])
+    # moving the blank up a row keeps the inversion count
+    assert is_solvable([1, 2, 3, 4, 5, 0, 7, 8, 6])
+
+
+def test_even_width_counts_the_blank_row():
+    assert is_solvable(GOAL_4, 4)
+    # one vertical slide: three inversions and the blank one row up
+    assert is_solvable([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 0, 13, 14, 15, 12], 4)
+    # Loyd's 14-15 puzzle
+    assert not is_solvable([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 15, 14, 0], 4)
+    # the blank one row up with no inversions
+    assert not is_solvable([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 0, 12, 13, 14, 15], 4)
+
+
+def test_goal_with_another_blank_cell():
+    goal = [0] + list(range(1, 16))
+    assert is_solvable(goal, 4, goal)
+    assert not is_solvable(GOAL_4, 4, goal)
@@ -0,0 +1,218 @@
+"""Solve many boards on a process pool and stream one JSON line per result.
+
+Input is one board per line, either whitespace/comma separated tiles
+("1 2 3 4 5 6 0 7 8"), a JSON list, or a JSON object {"id": ..., "board": [...]}.
+Blank lines and lines starting with # are skipped; a line that does not
+parse gives a result with solution_found false and an error, like a board
+whose solver failed.
+
+    python3 -m tools.batch_solve boards.txt -a astar --heuristic linear_conflict > out.jsonl
+"""
+import argparse
+import functools
+import importlib
+import json
+import os
+import signal
+import sys
+from math import isqrt
+
+from core.utils import board_to_2d
+
+ALGORITHMS = ('bfs', 'bibfs', 'dfs', 'ucs', 'astar', 'arastar', 'idastar', 'lookup')
+MOVE_LETTERS = {'Up': 'U', 'Down': 'D', 'Left': 'L', 'Right': 'R'}
+
+
+class TaskTimeout(Exception):
+    pass
+
+
+def parse_line(line):
+    """Return (id, flat board) for one input line, or None for blank/comment lines."""
+    line = line.strip()
+    if not line or line.startswith('#'):
+        return None
+    ident = None
+    if line[0] in '[{':
+        data = json.loads(line)
+        if isinstance(data, dict):
+            ident = data.get('id')
+            data = data['board']
+        flat = [t for row in data for t in row] if data and isinstance(data[0], list) else list(data)
+    else:
+        flat = [int(t) for t in line.replace(',', ' ').split()]
+    if isqrt(len(flat)) ** 2 != len(flat) or sorted(flat) != list(range(len(flat))):
+        raise ValueError("not a square board: %r" % line)
+    return ident, flat
+
+
+def _on_alarm(signum, frame):
+    raise TaskTimeout()
+
+
+_caches = {}
+
+
+def _cache(path):
+    """One SolutionCache per SQLite file per process."""
+    cache = _caches.get(path)
+    if cache is None:
+        from core.cache import SolutionCache
+        cache = _caches[path] = SolutionCache(path=path)
+    return cache
+
+
+def solve_one(algorithm, flat, goal=None, timeout=None, options=None, cache_path=None):
+    """Solve one flat board and return a JSON-ready dict (runs inside a worker).
+
+    cache_path names a SQLite solution cache shared by all workers.
+    """
+    n = isqrt(len(flat))
+    goal = goal or list(range(1, n * n)) + [0]
+    if cache_path:
+        solve = functools.partial(_cache(cache_path).solve, algorithm)
+    else:
+        solve = importlib.import_module('algorithms.' + algorithm).solve
+    use_alarm = timeout and hasattr(signal, 'setitimer')
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        path, stats = solve(board_to_2d(flat, n), board_to_2d(goal, n), **(options or {}))
+    except TaskTimeout:
+        return {'algorithm': algorithm, 'solution_found': False, 'error': 'timeout'}
+    except Exception as e:
+        return {'algorithm': algorithm, 'solution_found': False, 'error': '%s: %s' % (type(e).__name__, e)}
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    result = {'algorithm': algorithm, 'moves': ''.join(MOVE_LETTERS[s.move] for s in path[1:])}
+    # per-iteration detail (IDA*) does not belong in a one-line summary
+    result.update((k, v) for k, v in stats.items() if k != 'iterations')
+    return result
+
+
+def _solve_chunk(algorithm, chunk, goal, timeout, options, cache_path):
+    out = []
+    for index, ident, flat in chunk:
+        result = {'index': index}
+        if ident is not None:
+            result['id'] = ident
+        if isinstance(flat, str):
+            # a line that did not parse, reported where its result would be
+            result.update(solution_found=False, error=flat)
+        else:
+            result.update(solve_one(algorithm, flat, goal, timeout, options, cache_path))
+        out.append(result)
+    return out
+
+
+def _chunks(lines, size):
+    chunk = []
+    for index, line in enumerate(lines):
+        try:
+            parsed = parse_line(line)
+        except (ValueError, KeyError, TypeError) as e:
+            parsed = None, '%s: %s' % (type(e).__name__, e)
+        if parsed is None:
+            continue
+        chunk.append((index, parsed[0], parsed[1]))
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def run(lines, out, algorithm='astar', workers=None, chunk=1, window=None, timeout=None,
+        ordered=False, goal=None, options=None, cache_path=None):
+    """Fan boards out over a ProcessPoolExecutor and write results to out as they finish.
+
+    At most `window` chunks are in flight, so input is read lazily and
+    memory stays flat on large corpora. ordered=True buffers results so
+    they come out in input order.
+    """
+    # imported here: the pool machinery is most of this module's load time
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+    workers = workers or os.cpu_count() or 1
+    window = window or workers * 2
+    order = []  # input indices in submission order
+    buffered = {}
+    emitted = 0
+
+    def emit(results):
+        nonlocal emitted
+        for r in results:
+            if ordered:
+                buffered[r['index']] = r
+            else:
+                out.write(json.dumps(r) + '\n')
+        while emitted < len(order) and order[emitted] in buffered:
+            out.write(json.dumps(buffered.pop(order[emitted])) + '\n')
+            emitted += 1
+        out.flush()
+
+    with ProcessPoolExecutor(workers) as pool:
+        pending = set()
+        for c in _chunks(lines, chunk):
+            if len(pending) >= window:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for f in done:
+                    emit(f.result())
+            order.extend(index for index, _, _ in c)
+            pending.add(pool.submit(_solve_chunk, algorithm, c, goal, timeout, options, cache_path))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for f in done:
+                emit(f.result())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve boards in parallel; one JSON line per result.")
+    parser.add_argument('input', nargs='?', default='-', help="board file (default: stdin)")
+    parser.add_argument('-a', '--algorithm', default='astar', choices=ALGORITHMS)
+    parser.add_argument('--heuristic', default=None, help="heuristic name for astar/arastar/idastar, e.g. linear_conflict")
+    parser.add_argument('--goal', default=None, help="goal board, same format as input lines (default: 1..n*n-1 then blank)")
+    parser.add_argument('-j', '--workers', type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument('--chunk', type=int, default=1, help="boards per submitted task (default 1)")
+    parser.add_argument('--window', type=int, default=None, help="max tasks in flight (default: 2 per worker)")
+    parser.add_argument('--timeout', type=float, default=None, help="seconds per board before it is reported as a timeout")
+    parser.add_argument('--ordered', action='store_true', help="write results in input order instead of completion order")
+    parser.add_argument('--cache', default=None, help="SQLite solution cache file shared by all workers")
+    parser.add_argument('--memory-budget', type=float, default=None, metavar='MB',
+                        help="estimated search memory allowed per board, in MiB")
+    parser.add_argument('--on-budget', default='abort', choices=('abort', 'fallback'),
+                        help="over budget: report the board as unsolved, or finish it with IDA* (default: abort)")
+    parser.add_argument('--tt-size', type=int, default=None, metavar='ENTRIES',
+                        help="dfs/idastar: transposition table entries (default: dfs.TT_SIZE for dfs, none for idastar)")
+    parser.add_argument('--deadline', type=float, default=None,
+                        help="arastar: seconds per board before the best path so far is reported")
+    args = parser.parse_args(argv)
+
+    options = {}
+    if args.heuristic:
+        if args.algorithm not in ('astar', 'arastar', 'idastar'):
+            parser.error("--heuristic only applies to astar, arastar and idastar")
+        options['heuristic'] = args.heuristic
+    if args.deadline is not None:
+        if args.algorithm != 'arastar':
+            parser.error("--deadline only applies to arastar")
+        options['deadline'] = args.deadline
+    if args.tt_size is not None:
+        if args.algorithm not in ('dfs', 'idastar'):
+            parser.error("--tt-size only applies to dfs and idastar")
+        options['tt_size'] = args.tt_size
+    if args.memory_budget:
+        options.update(memory_budget=int(args.memory_budget * 2 ** 20), on_budget=args.on_budget)
+    goal = parse_line(args.goal)[1] if args.goal else None
+    src = sys.stdin if args.input == '-' else open(args.input)
+    try:
+        run(src, sys.stdout, args.algorithm, args.workers, args.chunk, args.window,
+            args.timeout, args.ordered, goal, options, args.cache)
+    finally:
+        if src is not sys.stdin:
+            src.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+"""Reproducible solver benchmarks over fixed instance sets bucketed by optimal depth.
+
+The instance sets live in tools/instances/*.json and are regenerated only
+with --make-instances (same seed, same boards):
+  - 3x3: three boards for every optimal depth 0-31 (fewer where fewer
+    exist), sampled from a full BFS of the state space;
+  - 15:  three seeded random-walk scrambles per walk length 10-50,
+    bucketed by their optimal depth as found by IDA*. This is not Korf's
+    standard set of 100 (optimal depths 41-66), which takes these
+    pure-Python solvers hours per board.
+
+    python3 -m tools.benchmark --suite 3x3 -a astar idastar --out base.json
+    python3 -m tools.benchmark --suite 3x3 -a astar idastar --compare base.json --threshold 0.1
+    python3 -m tools.benchmark --suite 15 --heuristic linear_conflict --scaling 1 2 4 8 16 32
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from statistics import median
+
+from core.utils import board_to_2d
+
+INSTANCE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'instances')
+SUITES = {'3x3': 3, '15': 4}
+DEFAULT_ALGORITHMS = {'3x3': ['bfs', 'bibfs', 'ucs', 'astar', 'idastar'], '15': ['astar', 'idastar']}
+
+
+def instance_path(suite):
+    return os.path.join(INSTANCE_DIR, suite + '.json')
+
+
+def make_instances_3x3(per_depth=3, seed=0):
+    from core import distdb
+    from core.ranking import unrank
+    from core.puzzle_state import decode
+    table = distdb.build()
+    by_depth = {}
+    for r, entry in enumerate(table):
+        if entry != distdb.UNREACHED:
+            by_depth.setdefault(entry >> 2, []).append(r)
+    rng = random.Random(seed)
+    instances = []
+    for depth in sorted(by_depth):
+        ranks = by_depth[depth]
+        for r in sorted(rng.sample(ranks, min(per_depth, len(ranks)))):
+            flat = [t for row in decode(unrank(r)) for t in row]
+            instances.append({'depth': depth, 'board': flat})
+    return instances
+
+
+def make_instances_15(per_walk=3, walks=(10, 20, 30, 40, 50), seed=0):
+    from algorithms import idastar
+    from solver import random_board
+    rng = random.Random(seed)
+    goal = board_to_2d(list(range(1, 16)) + [0], 4)
+    instances = []
+    for walk in walks:
+        for _ in range(per_walk):
+            flat = random_board(4, rng, walk)
+            _, stats = idastar.solve(board_to_2d(flat, 4), goal, heuristic='linear_conflict')
+            instances.append({'depth': stats['path_length'], 'board': flat})
+    instances.sort(key=lambda i: i['depth'])
+    return instances
+
+
+def load_instances(suite, depths=None):
+    with open(instance_path(suite)) as f:
+        instances = json.load(f)['instances']
+    if depths is not None:
+        instances = [i for i in instances if depths[0] <= i['depth'] <= depths[1]]
+    return instances
+
+
+def measure(solve, start, goal, reps=3, warmup=1, options=None):
+    """Median wall time over reps, plus nodes and tracemalloc peak of one extra run."""
+    options = options or {}
+    for _ in range(warmup):
+        solve(start, goal, **options)
+    times = []
+    for _ in range(reps):
+        t = time.perf_counter()
+        _, stats = solve(start, goal, **options)
+        times.append(time.perf_counter() - t)
+    # traced separately: tracemalloc slows allocation-heavy code several-fold
+    tracemalloc.start()
+    try:
+        solve(start, goal, **options)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {'time': median(times), 'nodes': stats['nodes_expanded'],
+            'path_length': stats['path_length'], 'peak_bytes': peak}
+
+
+def run(suite, algorithms, instances, reps=3, warmup=1, options=None, log=None):
+    """Benchmark every algorithm on every instance; results are bucketed by depth."""
+    import importlib
+    n = SUITES[suite]
+    goal = board_to_2d(list(range(1, n * n)) + [0], n)
+    results = {}
+    for algorithm in algorithms:
+        solve = importlib.import_module('algorithms.' + algorithm).solve
+        opts = options if algorithm in ('astar', 'arastar', 'hdastar', 'idastar') else None
+        buckets = results[algorithm] = {}
+        for inst in instances:
+            m = measure(solve, board_to_2d(inst['board'], n), goal, reps, warmup, opts)
+            b = buckets.setdefault(str(inst['depth']), {'instances': 0, 'time': 0.0, 'nodes': 0, 'peak_bytes': 0})
+            b['instances'] += 1
+            b['time'] += m['time']
+            b['nodes'] += m['nodes']
+            b['peak_bytes'] = max(b['peak_bytes'], m['peak_bytes'])
+        for b in buckets.values():
+            b['nodes_per_sec'] = b['nodes'] / b['time'] if b['time'] else 0.0
+        if log:
+            log.write("%-8s %8.3fs total\n" % (algorithm, sum(b['time'] for b in buckets.values())))
+    return {
+        'suite': suite,
+        'reps': reps,
+        'warmup': warmup,
+        'options': options or {},
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'results': results,
+    }
+
+
+def scaling(suite, instances, worker_counts, reps=1, options=None, log=None):
+    """Time hdastar on the whole instance set for each worker count.
+
+    One worker is plain A*, the baseline for speedup; nodes shows the
+    search overhead of expanding out of global f order.
+    """
+    from algorithms import hdastar
+    n = SUITES[suite]
+    goal = board_to_2d(list(range(1, n * n)) + [0], n)
+    rows = []
+    for workers in worker_counts:
+        opts = dict(options or {}, workers=workers)
+        total = 0.0
+        nodes = 0
+        for inst in instances:
+            times = []
+            for _ in range(reps):
+                t = time.perf_counter()
+                _, stats = hdastar.solve(board_to_2d(inst['board'], n), goal, **opts)
+                times.append(time.perf_counter() - t)
+            total += median(times)
+            nodes += stats['nodes_expanded']
+        rows.append({'workers': workers, 'time': total, 'nodes': nodes})
+        if log:
+            log.write("%3d workers %8.3fs total\n" % (workers, total))
+    base = rows[0]['time']
+    for row in rows:
+        row['speedup'] = base / row['time'] if row['time'] else 0.0
+        row['efficiency'] = row['speedup'] / row['workers'] * rows[0]['workers']
+    return rows
+
+
+def print_scaling(rows, out):
+    out.write("%7s %10s %12s %8s %10s\n" % ('workers', 'time (s)', 'nodes', 'speedup', 'efficiency'))
+    for row in rows:
+        out.write("%7d %10.4f %12s %7.2fx %9.0f%%\n" % (
+            row['workers'], row['time'], format(row['nodes'], ','), row['speedup'], row['efficiency'] * 100))
+
+
+def compare(old, new, threshold=0.10):
+    """Return (algorithm, depth, old time, new time) for buckets slower by more than threshold."""
+    regressions = []
+    for algorithm, buckets in new['results'].items():
+        for depth, b in buckets.items():
+            before = old['results'].get(algorithm, {}).get(depth)
+            if before and before['instances'] == b['instances'] and b['time'] > before['time'] * (1 + threshold):
+                regressions.append((algorithm, depth, before['time'], b['time']))
+    return regressions
+
+
+def print_table(baseline, out):
+    out.write("%-8s %5s %4s %10s %12s %12s %10s\n" % (
+        'algo', 'depth', 'n', 'time (s)', 'nodes', 'nodes/s', 'peak KB'))
+    for algorithm, buckets in baseline['results'].items():
+        for depth in sorted(buckets, key=int):
+            b = buckets[depth]
+            out.write("%-8s %5s %4d %10.4f %12s %12s %10d\n" % (
+                algorithm, depth, b['instances'], b['time'], format(b['nodes'], ','),
+                format(int(b['nodes_per_sec']), ','), b['peak_bytes'] // 1024))
+
+
+def _depth_range(text):
+    lo, _, hi = text.partition('-')
+    return int(lo), int(hi or lo)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark solvers on fixed depth-bucketed instance sets.")
+    parser.add_argument('--suite', choices=sorted(SUITES), default='3x3')
+    parser.add_argument('-a', '--algorithms', nargs='+', default=None,
+                        help="algorithm modules (default: %s)" % '; '.join(
+                            '%s: %s' % (s, ' '.join(a)) for s, a in sorted(DEFAULT_ALGORITHMS.items())))
+    parser.add_argument('--heuristic', default=None, help="heuristic for astar/arastar/idastar")
+    parser.add_argument('--depths', type=_depth_range, default=None, help="optimal depth range, e.g. 20-31")
+    parser.add_argument('--reps', type=int, default=3)
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--out', default=None, help="write the results as a JSON baseline")
+    parser.add_argument('--compare', default=None, help="baseline JSON to check for regressions")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="allowed slowdown per depth bucket before failing (default 0.10 = 10%%)")
+    parser.add_argument('--scaling', type=int, nargs='+', default=None, metavar='WORKERS',
+                        help="time hdastar at these worker counts and report speedup over the first")
+    parser.add_argument('--make-instances', action='store_true', help="regenerate the instance file and exit")
+    parser.add_argument('--seed', type=int, default=0, help="seed for --make-instances")
+    args = parser.parse_args(argv)
+
+    if args.make_instances:
+        instances = make_instances_3x3(seed=args.seed) if args.suite == '3x3' else make_instances_15(seed=args.seed)
+        os.makedirs(INSTANCE_DIR, exist_ok=True)
+        with open(instance_path(args.suite), 'w') as f:
+            # one instance per line keeps diffs of regenerated sets readable
+            f.write('{"suite": %s, "seed": %d, "instances": [\n' % (json.dumps(args.suite), args.seed))
+            f.write(',\n'.join(json.dumps(i) for i in instances))
+            f.write('\n]}\n')
+        print("%s: %d instances" % (instance_path(args.suite), len(instances)))
+        return 0
+
+    options = {'heuristic': args.heuristic} if args.heuristic else None
+    instances = load_instances(args.suite, args.depths)
+    if args.scaling:
+        rows = scaling(args.suite, instances, args.scaling, args.reps, options, sys.stderr)
+        print_scaling(rows, sys.stdout)
+        if args.out:
+            with open(args.out, 'w') as f:
+                json.dump({'suite': args.suite, 'options': options or {}, 'cpus': os.cpu_count(),
+                           'scaling': rows}, f, indent=1)
+        return 0
+    baseline = run(args.suite, args.algorithms or DEFAULT_ALGORITHMS[args.suite], instances,
+                   args.reps, args.warmup, options, sys.stderr)
+    print_table(baseline, sys.stdout)
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(baseline, f, indent=1)
+    if args.compare:
+        with open(args.compare) as f:
+            old = json.load(f)
+        regressions = compare(old, baseline, args.threshold)
+        for algorithm, depth, before, after in regressions:
+            print("REGRESSION %s depth %s: %.4fs -> %.4fs (%+.0f%%)" % (
+                algorithm, depth, before, after, (after / before - 1) * 100))
+        if regressions:
+            return 1
+        print("no regressions above %.0f%%" % (args.threshold * 100))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
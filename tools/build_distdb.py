@@ -0,0 +1,29 @@
+import argparse
+import time
+
+from core import distdb
+from core.symmetry import blank_classes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the 8-puzzle all-states distance table.")
+    parser.add_argument('--blank', type=int, action='append',
+                        help="goal blank cell (0-8); repeatable, default 8 as in the UI goal")
+    parser.add_argument('--all-blanks', action='store_true',
+                        help="build the tables lookup needs for any goal (blank cells %s; "
+                             "the others are rotations/reflections of these)" % blank_classes(distdb.N))
+    parser.add_argument('--dir', default=None, help="output directory (default: %s)" % distdb.DEFAULT_DIR)
+    args = parser.parse_args(argv)
+
+    blanks = blank_classes(distdb.N) if args.all_blanks else (args.blank or [distdb.SIZE - 1])
+    for blank in blanks:
+        start = time.time()
+        table = distdb.build(blank)
+        path = distdb.table_path(blank, args.dir)
+        distdb.write(path, table, blank)
+        depth = max(b >> 2 for b in table if b != distdb.UNREACHED)
+        print("blank %d: %s (max depth %d, %.2fs)" % (blank, path, depth, time.time() - start))
+
+
+if __name__ == "__main__":
+    main()
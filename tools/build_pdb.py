@@ -0,0 +1,42 @@
+import argparse
+import os
+import time
+
+from core import patterndb
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build additive pattern databases.")
+    parser.add_argument('--width', type=int, default=4, help="board width (default 4, the 15-puzzle)")
+    parser.add_argument('--split', default=None,
+                        help="tile split, e.g. 663 or 78 for 4x4 (default: %s)" %
+                        ', '.join('%s for %dx%d' % (s, n, n) for n, s in sorted(patterndb.DEFAULT_SPLIT.items())))
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="processes expanding each BFS layer (default: all cores)")
+    parser.add_argument('--force', action='store_true', help="rebuild tables that already exist")
+    parser.add_argument('--dir', default=None, help="output directory (default: %s)" % patterndb.DEFAULT_DIR)
+    args = parser.parse_args(argv)
+
+    split = args.split or patterndb.DEFAULT_SPLIT.get(args.width)
+    if (args.width, split) not in patterndb.SPLITS:
+        parser.error("no split %r for width %d (known: %s)" % (
+            split, args.width, ', '.join('%s/%d' % (s, n) for n, s in sorted(patterndb.SPLITS))))
+    groups = patterndb.SPLITS[(args.width, split)]
+    for j, cells in enumerate(groups):
+        mirror = patterndb.mirror_of(args.width, cells, groups[:j])
+        if mirror is not None:
+            print("cells %s: mirror of %s, no table needed" % (list(cells), list(groups[mirror[0]])))
+            continue
+        path = patterndb.table_path(args.width, cells, args.dir)
+        if os.path.exists(path) and not args.force:
+            print("cells %s: %s exists, skipping" % (list(cells), path))
+            continue
+        start = time.time()
+        table = patterndb.build(args.width, cells, args.workers)
+        patterndb.write(path, table, args.width, cells)
+        print("cells %s: %s (%d entries, max %d, %.2fs)" % (
+            list(cells), path, len(table), max(table), time.time() - start))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import argparse
+import json
+import time
+
+from core.puzzle_state import decode
+from core.ranking import unrank
+from core.utils import canonical_goal
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Enumerate every state reachable from a goal by layered BFS (needs NumPy).")
+    parser.add_argument('--width', type=int, default=3, choices=(2, 3), help="board width (default 3)")
+    parser.add_argument('--blank', type=int, default=None, help="goal blank cell (default: the last cell)")
+    parser.add_argument('--out', default=None, help="also write the statistics as JSON to this file")
+    args = parser.parse_args(argv)
+    try:
+        from core.statespace import layered_bfs
+    except ImportError:
+        parser.error("the state-space engine needs NumPy (pip install numpy)")
+
+    size = args.width * args.width
+    blank = size - 1 if args.blank is None else args.blank
+    if not 0 <= blank < size:
+        parser.error("--blank must be a cell from 0 to %d" % (size - 1))
+    goal = canonical_goal(blank, args.width)
+    start = time.time()
+    result = layered_bfs(goal)
+    elapsed = time.time() - start
+
+    layers = result['layers']
+    print("%5s %8s %7s" % ("depth", "states", "growth"))
+    for depth, count in enumerate(layers):
+        growth = " %7.3f" % (count / layers[depth - 1]) if depth else ""
+        print("%5d %8d%s" % (depth, count, growth))
+    print("%d states, max depth %d, mean branching %.4f (%d moves from %d states), %.3fs" % (
+        result['states'], result['max_depth'], result['mean_branching'], result['generated'],
+        result['expanded'], elapsed))
+    antipodes = [decode(unrank(r, size), args.width) for r in result['antipodes']]
+    print("%d antipodal states at depth %d:" % (len(antipodes), result['max_depth']))
+    for board in antipodes[:10]:
+        print("  %s" % ' '.join(str(t) for row in board for t in row))
+    if len(antipodes) > 10:
+        print("  ...")
+
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump({'width': args.width, 'goal': goal, 'layers': layers, 'states': result['states'],
+                       'max_depth': result['max_depth'], 'mean_branching': result['mean_branching'],
+                       'generated': result['generated'], 'antipodes': antipodes,
+                       'seconds': round(elapsed, 4)}, f, indent=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,24 +1,30 @@
 
 import tkinter as tk
 from tkinter import messagebox, ttk
+import queue
 import random
+import threading
 import time
 
-from core.utils import board_to_2d, board_to_1d
-from algorithms import bfs, dfs, ucs, astar
+from core.cache import SolutionCache
+from core.control import SearchCancelled, SearchControl
+from core.utils import board_to_2d, board_to_1d, is_solvable
+from core.heuristics import HEURISTICS, usable
 
 N = 3
-SIZE = N * N
 
 class PuzzleGUI:
-    def __init__(self, root):
+    def __init__(self, root, n=N):
         self.root = root
-        self.root.title("8-Puzzle AI Solver")
+        self.n = n
+        self.size = n * n
+        self.title = f"{self.size - 1}-Puzzle AI Solver"
+        self.root.title(self.title)
         self.root.geometry("800x700")
         self.root.configure(bg="#f0f0f0")
 
-        self.numbers = list(range(1, SIZE)) + [0]
-        self.goal_state = list(range(1, SIZE)) + [0]
+        self.numbers = list(range(1, self.size)) + [0]
+        self.goal_state = list(range(1, self.size)) + [0]
         self.current_state = self.numbers.copy()
 
         self.buttons = []
@@ -26,10 +32,26 @@ class PuzzleGUI:
         self.start_time = None
         self.timer_running = False
         self.is_solving = False
+        self.control = None
+        self.cache = SolutionCache(maxsize=256)
         self.solution_steps = []
         self.current_step = 0
 
-        self.algorithms = ["BFS", "DFS", "UCS", "A*"]
+        # display name -> algorithms.<module>, imported on first solve
+        self.algorithm_modules = {"BFS": "bfs", "Bi-BFS": "bibfs", "DFS": "dfs",
+                                  "UCS": "ucs", "A*": "astar", "ARA*": "arastar", "IDA*": "idastar"}
+        self.algorithms = list(self.algorithm_modules)
+        self.heuristics = {
+            "Manhattan Distance": "manhattan",
+            "Linear Conflict": "linear_conflict",
+            "Walking Distance": "walking_distance",
+            "Misplaced Tiles": "misplaced",
+            "Max(Linear Conflict, Walking Distance)": ["linear_conflict", "walking_distance"],
+        }
+        self.heuristics.update((name, name) for name in HEURISTICS if name not in self.heuristics.values())
+        # only offer what can be built for this width (walking distance up to 4x4, ...)
+        self.heuristics = {label: spec for label, spec in self.heuristics.items()
+                           if all(usable(name, self.n) for name in ([spec] if isinstance(spec, str) else spec))}
         self.create_widgets()
         self.shuffle_puzzle()
         self.update_display()
@@ -38,7 +60,7 @@ class PuzzleGUI:
         main_frame = tk.Frame(self.root, bg="#f0f0f0")
         main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
 
-        title_label = tk.Label(main_frame, text="8-Puzzle AI Solver",
+        title_label = tk.Label(main_frame, text=self.title,
                                font=("Arial", 24, "bold"), bg="#f0f0f0", fg="#333")
         title_label.pack(pady=(0, 20))
 
@@ -49,11 +71,12 @@ class PuzzleGUI:
         puzzle_frame.pack(pady=10)
 
         self.buttons = []
-        for i in range(N):
+        tile_font = ("Arial", 28 if self.n <= 3 else 84 // self.n, "bold")
+        for i in range(self.n):
             row_buttons = []
-            for j in range(N):
+            for j in range(self.n):
                 btn = tk.Button(
-                    puzzle_frame, text="", font=("Arial", 28, "bold"),
+                    puzzle_frame, text="", font=tile_font,
                     width=4, height=2, bd=3, relief=tk.RAISED,
                     bg="#4FC3F7", activebackground="#29B6F6",
                     command=lambda r=i, c=j: self.tile_click(r, c)
@@ -95,22 +118,34 @@ class PuzzleGUI:
                                        values=self.algorithms, state="readonly", font=("Arial", 11), width=15)
         self.algo_combo.pack(fill=tk.X, pady=5)
 
+        tk.Label(algo_frame, text="Heuristic (A*, IDA*):", font=("Arial", 12), bg="#e0e0e0").pack(anchor="w")
+        self.heuristic_var = tk.StringVar(value="Manhattan Distance")
+        self.heuristic_combo = ttk.Combobox(algo_frame, textvariable=self.heuristic_var,
+                                            values=list(self.heuristics), state="readonly", font=("Arial", 11), width=15)
+        self.heuristic_combo.pack(fill=tk.X, pady=5)
+
         self.solve_btn = tk.Button(algo_frame, text=" Solve Puzzle", font=("Arial", 13, "bold"),
                                    bg="#FF9800", fg="white", padx=20, pady=10, command=self.solve_puzzle)
-        self.solve_btn.pack(pady=10)
+        self.solve_btn.pack(pady=(10, 5))
+
+        self.cancel_btn = tk.Button(algo_frame, text=" Cancel", font=("Arial", 11),
+                                    bg="#F44336", fg="white", padx=20, state=tk.DISABLED, command=self.cancel_solve)
+        self.cancel_btn.pack(pady=(0, 5))
+
+        self.progress_label = tk.Label(algo_frame, text="", font=("Arial", 9), bg="#e0e0e0", fg="#555")
+        self.progress_label.pack()
 
         info_frame2 = tk.LabelFrame(right_panel, text="Algorithm Properties",
                                     font=("Arial", 12, "bold"), bg="#e0e0e0", padx=10, pady=10)
         info_frame2.pack(fill=tk.X, padx=10, pady=5)
 
         info_text = (
-            "• BFS: Complete & Optimal (memory intensive)
-"
-            "• DFS: Not optimal (depth limited)
-"
-            "• UCS: Complete & Optimal (considers costs)
-"
-            "• A*: Complete & Optimal (most efficient)"
+            "• BFS: Complete & Optimal (memory intensive)\n"
+            "• Bi-BFS: Complete & Optimal (meets in the middle)\n"
+            "• DFS: Complete & Optimal (iterative deepening)\n"
+            "• UCS: Complete & Optimal (considers costs)\n"
+            "• A*: Complete & Optimal (most efficient)\n"
+            "• IDA*: Complete & Optimal (linear memory)"
         )
         info_label = tk.Label(info_frame2, text=info_text, font=("Arial", 9),
                               bg="#e0e0e0", fg="#555", justify=tk.LEFT)
@@ -148,18 +183,13 @@ class PuzzleGUI:
         self.results_text.config(yscrollcommand=scrollbar.set)
         scrollbar.config(command=self.results_text.yview)
 
-        self.results_text.insert(tk.END, "Performance Results
-")
-        self.results_text.insert(tk.END, "=" * 30 + "
-
-")
-        self.results_text.insert(tk.END, "Select algorithm and click 'Solve Puzzle'
-")
-        self.results_text.insert(tk.END, "to see detailed metrics.
-")
+        self.results_text.insert(tk.END, "Performance Results\n")
+        self.results_text.insert(tk.END, "=" * 30 + "\n\n")
+        self.results_text.insert(tk.END, "Select algorithm and click 'Solve Puzzle'\n")
+        self.results_text.insert(tk.END, "to see detailed metrics.\n")
 
     # Helpers
-    def board_to_2d(self, flat): return board_to_2d(flat, N)
+    def board_to_2d(self, flat): return board_to_2d(flat, self.n)
     def board_to_1d(self, grid): return board_to_1d(grid)
 
     def shuffle_puzzle(self):
@@ -169,13 +199,7 @@ class PuzzleGUI:
         self.timer_label.config(text="Time: 00:00")
         while True:
             random.shuffle(self.numbers)
-            inversions = 0
-            for i in range(SIZE):
-                if self.numbers[i] == 0: continue
-                for j in range(i + 1, SIZE):
-                    if self.numbers[j] != 0 and self.numbers[i] > self.numbers[j]:
-                        inversions += 1
-            if inversions % 2 == 0:
+            if is_solvable(self.numbers, self.n, self.goal_state):
                 break
         self.current_state = self.numbers.copy()
         self.update_display()
@@ -185,9 +209,9 @@ class PuzzleGUI:
         self.shuffle_puzzle()
 
     def update_display(self):
-        for i in range(N):
-            for j in range(N):
-                idx = i * N + j
+        for i in range(self.n):
+            for j in range(self.n):
+                idx = i * self.n + j
                 value = self.current_state[idx]
                 if value == 0:
                     self.buttons[i][j].config(text="", bg="#BDBDBD")
@@ -195,7 +219,7 @@ class PuzzleGUI:
                     self.buttons[i][j].config(text=str(value), bg="#4FC3F7")
 
     def find_empty_idx(self):
-        for i in range(SIZE):
+        for i in range(self.size):
             if self.current_state[i] == 0:
                 return i
         return -1
@@ -203,10 +227,10 @@ class PuzzleGUI:
     def tile_click(self, row, col):
         if self.is_solving:
             return
-        idx = row * N + col
+        idx = row * self.n + col
         empty_idx = self.find_empty_idx()
-        row_diff = abs(row - (empty_idx // N))
-        col_diff = abs(col - (empty_idx % N))
+        row_diff = abs(row - (empty_idx // self.n))
+        col_diff = abs(col - (empty_idx % self.n))
         if (row_diff == 1 and col_diff == 0) or (row_diff == 0 and col_diff == 1):
             self.current_state[empty_idx], self.current_state[idx] = self.current_state[idx], self.current_state[empty_idx]
             self.moves += 1
@@ -241,55 +265,88 @@ class PuzzleGUI:
         self.next_btn.config(state=tk.DISABLED)
         self.play_btn.config(state=tk.DISABLED)
         self.results_text.delete(1.0, tk.END)
-        self.results_text.insert(tk.END, "Performance Results
-")
-        self.results_text.insert(tk.END, "=" * 30 + "
-
-")
-        self.results_text.insert(tk.END, "Select algorithm and click 'Solve Puzzle'
-")
-        self.results_text.insert(tk.END, "to see detailed metrics.
-")
+        self.results_text.insert(tk.END, "Performance Results\n")
+        self.results_text.insert(tk.END, "=" * 30 + "\n\n")
+        self.results_text.insert(tk.END, "Select algorithm and click 'Solve Puzzle'\n")
+        self.results_text.insert(tk.END, "to see detailed metrics.\n")
 
     def solve_puzzle(self):
         if self.is_solving:
             return
         self.is_solving = True
         self.solve_btn.config(state=tk.DISABLED)
+        self.cancel_btn.config(state=tk.NORMAL)
         self.shuffle_btn.config(state=tk.DISABLED)
         self.reset_btn.config(state=tk.DISABLED)
 
         start_board = self.board_to_2d(self.current_state)
         goal_board = self.board_to_2d(self.goal_state)
         algo = self.algo_var.get()
+        options = {}
+        if algo in ("A*", "ARA*", "IDA*"):
+            options["heuristic"] = self.heuristics[self.heuristic_var.get()]
+        if algo == "ARA*":
+            options["deadline"] = 1.0
 
         self.results_text.delete(1.0, tk.END)
-        self.results_text.insert(tk.END, f"Solving with {algo}...
-")
-        self.root.update()
-
-        try:
-            if algo == "BFS":
-                path, stats = bfs.solve(start_board, goal_board)
-            elif algo == "DFS":
-                path, stats = dfs.solve(start_board, goal_board)
-            elif algo == "UCS":
-                path, stats = ucs.solve(start_board, goal_board)
-            elif algo == "A*":
-                path, stats = astar.solve(start_board, goal_board)
-            else:
-                path, stats = [], {'solution_found': False}
-        except Exception as e:
-            self.results_text.insert(tk.END, f"Error: {e}
-")
-            path, stats = [], {'solution_found': False}
+        self.results_text.insert(tk.END, f"Solving with {algo}...\n")
+        self.progress_label.config(text="")
+
+        # the search runs on a worker thread; it only talks to Tk through this queue
+        messages = queue.Queue()
+        self.control = SearchControl(lambda snap: messages.put(("progress", snap)))
+
+        def work():
+            try:
+                messages.put(("done", self.cache.solve(self.algorithm_modules[algo], start_board, goal_board,
+                                                       control=self.control, **options)))
+            except SearchCancelled:
+                messages.put(("cancelled", None))
+            except Exception as e:
+                messages.put(("error", e))
+
+        threading.Thread(target=work, daemon=True).start()
+        self.root.after(50, self._poll_solver, messages, algo)
+
+    def cancel_solve(self):
+        if self.control is not None:
+            self.control.cancel()
+            self.cancel_btn.config(state=tk.DISABLED)
+
+    def _poll_solver(self, messages, algo):
+        while True:
+            try:
+                kind, payload = messages.get_nowait()
+            except queue.Empty:
+                self.root.after(50, self._poll_solver, messages, algo)
+                return
+            if kind == "progress":
+                self.progress_label.config(text=(
+                    f"Nodes: {payload['nodes_expanded']:,}  Frontier: {payload['frontier']:,}  "
+                    f"{payload['elapsed']:.1f}s"))
+                continue
+            break
+
+        if kind == "done":
+            self._show_result(algo, *payload)
+        elif kind == "cancelled":
+            self.results_text.insert(tk.END, f" {algo}: Cancelled\n")
+        else:
+            self.results_text.insert(tk.END, f"Error: {payload}\n")
+            self._show_result(algo, [], {'solution_found': False})
 
-        if stats.get('solution_found'):
-            self.results_text.insert(tk.END, f" {algo} Solution Found!
-")
-            self.results_text.insert(tk.END, "=" * 40 + "
+        self.results_text.see(tk.END)
+        self.control = None
+        self.is_solving = False
+        self.solve_btn.config(state=tk.NORMAL)
+        self.cancel_btn.config(state=tk.DISABLED)
+        self.shuffle_btn.config(state=tk.NORMAL)
+        self.reset_btn.config(state=tk.NORMAL)
 
-")
+    def _show_result(self, algo, path, stats):
+        if stats.get('solution_found'):
+            self.results_text.insert(tk.END, f" {algo} Solution Found!\n")
+            self.results_text.insert(tk.END, "=" * 40 + "\n\n")
             self.solution_steps = [self.board_to_1d(s.board) for s in path]
             self.current_step = 0
             if len(self.solution_steps) > 1:
@@ -297,71 +354,48 @@ class PuzzleGUI:
                 self.play_btn.config(state=tk.NORMAL)
             self._print_stats(stats, algo)
         else:
-            self.results_text.insert(tk.END, f" {algo}: No Solution Found
-")
-            self.results_text.insert(tk.END, "=" * 40 + "
-
-")
+            self.results_text.insert(tk.END, f" {algo}: No Solution Found\n")
+            self.results_text.insert(tk.END, "=" * 40 + "\n\n")
             self._print_stats(stats, algo)
-            if algo == "DFS":
-                self.results_text.insert(tk.END, "
-Note: DFS depth limit (50) reached.
-")
-                self.results_text.insert(tk.END, "Try BFS, UCS, or A* for guaranteed solution.
-")
-
-        self.results_text.see(tk.END)
-        self.is_solving = False
-        self.solve_btn.config(state=tk.NORMAL)
-        self.shuffle_btn.config(state=tk.NORMAL)
-        self.reset_btn.config(state=tk.NORMAL)
+            if algo == "DFS" and stats.get('iterations'):
+                self.results_text.insert(tk.END, "\nNote: no solution within %d moves.\n" % len(stats['iterations']))
 
     def _print_stats(self, stats, algo):
-        self.results_text.insert(tk.END, "PERFORMANCE METRICS:
-")
-        self.results_text.insert(tk.END, "─" * 20 + "
-")
-        self.results_text.insert(tk.END, f"• Solution Path: {stats.get('path_length', 0)} moves
-")
-        self.results_text.insert(tk.END, f"• Time Taken: {stats.get('execution_time', 0):.4f} seconds
-")
-        self.results_text.insert(tk.END, f"• Nodes Expanded: {stats.get('nodes_expanded', 0):,}
-")
-        self.results_text.insert(tk.END, f"• States Visited: {stats.get('visited_states', 0):,}
-")
-        self.results_text.insert(tk.END, f"• Max Frontier Size: {stats.get('max_frontier', 0):,}
-")
-
-        self.results_text.insert(tk.END, "
-ALGORITHM PROPERTIES:
-")
-        self.results_text.insert(tk.END, "─" * 20 + "
-")
+        self.results_text.insert(tk.END, "PERFORMANCE METRICS:\n")
+        self.results_text.insert(tk.END, "─" * 20 + "\n")
+        self.results_text.insert(tk.END, f"• Solution Path: {stats.get('path_length', 0)} moves\n")
+        self.results_text.insert(tk.END, f"• Time Taken: {stats.get('execution_time', 0):.4f} seconds\n")
+        self.results_text.insert(tk.END, f"• Nodes Expanded: {stats.get('nodes_expanded', 0):,}\n")
+        self.results_text.insert(tk.END, f"• States Visited: {stats.get('visited_states', 0):,}\n")
+        self.results_text.insert(tk.END, f"• Max Frontier Size: {stats.get('max_frontier', 0):,}\n")
+        if 'cache_hit' in stats:
+            self.results_text.insert(tk.END, f"• Cache: {'hit' if stats['cache_hit'] else 'miss'} "
+                                             f"({stats['cache_hits']} hits / {stats['cache_misses']} misses)\n")
+
+        self.results_text.insert(tk.END, "\nALGORITHM PROPERTIES:\n")
+        self.results_text.insert(tk.END, "─" * 20 + "\n")
         if algo == "BFS":
-            self.results_text.insert(tk.END, "• Completeness: Yes
-• Optimality: Yes
-• Time Complexity: O(b^d)
-• Space Complexity: O(b^d)
-")
+            self.results_text.insert(tk.END, "• Completeness: Yes\n• Optimality: Yes\n• Time Complexity: O(b^d)\n• Space Complexity: O(b^d)\n")
+        elif algo == "Bi-BFS":
+            self.results_text.insert(tk.END, "• Completeness: Yes\n• Optimality: Yes\n• Time Complexity: O(b^(d/2))\n• Space Complexity: O(b^(d/2))\n")
+            self.results_text.insert(tk.END, f"• Frontiers: {stats.get('forward_frontier', 0):,} fwd / {stats.get('backward_frontier', 0):,} bwd\n")
         elif algo == "DFS":
-            self.results_text.insert(tk.END, "• Completeness: Limited (depth)
-• Optimality: No
-• Time Complexity: O(b^m)
-• Space Complexity: O(bm)
-")
+            self.results_text.insert(tk.END, "• Completeness: Yes (iterative deepening)\n• Optimality: Yes\n• Time Complexity: O(b^d)\n• Space Complexity: O(bd)\n")
+            self.results_text.insert(tk.END, f"• Depth Limits Tried: {len(stats.get('iterations', []))}\n")
         elif algo == "UCS":
-            self.results_text.insert(tk.END, "• Completeness: Yes
-• Optimality: Yes
-• Time Complexity: O(b^{C*/ε})
-• Space Complexity: O(b^{C*/ε})
-")
+            self.results_text.insert(tk.END, "• Completeness: Yes\n• Optimality: Yes\n• Time Complexity: O(b^{C*/ε})\n• Space Complexity: O(b^{C*/ε})\n")
         elif algo == "A*":
-            self.results_text.insert(tk.END, "• Completeness: Yes
-• Optimality: Yes
-• Time Complexity: O(b^d)
-• Space Complexity: O(b^d)
-• Heuristic Used: Manhattan Distance
-")
+            self.results_text.insert(tk.END, "• Completeness: Yes\n• Optimality: Yes\n• Time Complexity: O(b^d)\n• Space Complexity: O(b^d)\n")
+            self.results_text.insert(tk.END, f"• Heuristic Used: {self.heuristic_var.get()}\n")
+        elif algo == "ARA*":
+            self.results_text.insert(tk.END, "• Completeness: Yes\n• Optimality: Bounded (anytime, 1 s deadline)\n• Time Complexity: O(b^d)\n• Space Complexity: O(b^d)\n")
+            self.results_text.insert(tk.END, f"• Heuristic Used: {self.heuristic_var.get()}\n")
+            bound = stats.get('suboptimality_bound')
+            self.results_text.insert(tk.END, f"• Suboptimality Bound: {bound:.3f}\n" if bound else "• Suboptimality Bound: none yet\n")
+        elif algo == "IDA*":
+            self.results_text.insert(tk.END, "• Completeness: Yes\n• Optimality: Yes\n• Time Complexity: O(b^d)\n• Space Complexity: O(d)\n")
+            self.results_text.insert(tk.END, f"• Heuristic Used: {self.heuristic_var.get()}\n")
+            self.results_text.insert(tk.END, f"• Iterations: {len(stats.get('iterations', []))}\n")
 
     def prev_step(self):
         if self.current_step > 0: